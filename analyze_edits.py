@@ -1,53 +1,132 @@
 #!/usr/bin/env python3
 """Analyze the differences between AI-generated cuts and manual edits."""
 
-import xml.etree.ElementTree as ET
 import re
+from bisect import bisect_right
+from array import array
+from functools import lru_cache
+from itertools import chain, compress
 from pathlib import Path
+from xml.parsers import expat
+
+# Clip names from either naming convention
+CLIP_NAME_PATTERN = re.compile(r'ios26 off 1 multi|ios 26 off')
+
+
+# Upper bounds (seconds) of the clip length distribution buckets
+DISTRIBUTION_EDGES = (2, 5, 10, 20)
+
+# FCPXML rational time such as "3600s", "1001/30000s" or "-2002/30000s"
+RATIONAL_TIME_PATTERN = re.compile(r'(-?\d+)(?:/(\d+))?s?$')
+
+
+@lru_cache(maxsize=1 << 16)
+def to_seconds(time_str):
+    """Convert an FCPXML rational time string to seconds."""
+    if not time_str:
+        return 0
+    match = RATIONAL_TIME_PATTERN.match(time_str)
+    if match is None:
+        # Decimal seconds, e.g. "1.5s"
+        return float(time_str.rstrip('s'))
+    num, denom = match.groups()
+    if denom:
+        return int(num) / int(denom)
+    return float(num)
+
+def make_time_decoder(time_strings):
+    """
+    Build a time decoder specialized for the timebase used by `time_strings`.
+
+    FCP writes every rational time of a project over the same denominator,
+    so the first one seen fixes the suffix (e.g. "/24000s") and the divisor.
+    Strings with that suffix only need their numerator parsed; anything else
+    (whole seconds, decimals, a mixed timebase) falls back to `to_seconds`.
+
+    Args:
+        time_strings (Iterable[str]): Raw time strings to sample the timebase from
+
+    Returns:
+        Callable[[str], float]: Decoder from time string to seconds
+    """
+    for time_str in time_strings:
+        slash = time_str.find('/')
+        if slash != -1 and time_str.endswith('s'):
+            suffix = time_str[slash:]
+            break
+    else:
+        return to_seconds
 
-def extract_mc_clips(fcpxml_path):
-    """Extract all multicam clip information from FCPXML."""
-    tree = ET.parse(fcpxml_path)
-    root = tree.getroot()
+    try:
+        denom = float(int(suffix[1:-1]))
+    except ValueError:
+        return to_seconds
+    cut = -len(suffix)
 
-    clips = []
+    def decode(time_str):
+        if time_str.endswith(suffix):
+            # Both operands are exact doubles, so this rounds like int / int
+            return int(time_str[:cut]) / denom
+        return to_seconds(time_str)
 
-    # Find all mc-clip elements (both naming conventions)
-    for mc_clip in root.findall('.//mc-clip'):
-        name = mc_clip.get('name', '')
+    return decode
+
+def extract_mc_clips(fcpxml_path):
+    """
+    Extract multicam clip timings from FCPXML, sorted by offset.
+
+    Timings are stored column-wise as contiguous float arrays rather than
+    one dict per clip, so sums and filters run over packed doubles.
+
+    Returns:
+        Dict[str, array]: 'offset_seconds', 'start_seconds' and 'duration_seconds' columns
+    """
+    raw_offsets, raw_starts, raw_durations = [], [], []
+
+    def start_element(name, attrs):
+        # expat runs without namespace processing, so a default xmlns never
+        # reaches the tag name; only an explicit prefix ("fcp:mc-clip") does
+        if name != 'mc-clip' and not name.endswith(':mc-clip'):
+            return
         # Include clips that match either naming pattern
-        if 'ios26 off 1 multi' in name or 'ios 26 off' in name:
-            # Get timing info
-            offset = mc_clip.get('offset', '0s')
-            start = mc_clip.get('start', '0s')
-            duration = mc_clip.get('duration', '0s')
-
-            # Convert rational time to seconds
-            def to_seconds(time_str):
-                if not time_str:
-                    return 0
-                # Remove 's' suffix
-                time_str = time_str.rstrip('s')
-                if '/' in time_str:
-                    num, denom = time_str.split('/')
-                    return float(num) / float(denom)
-                return float(time_str)
-
-            clip_info = {
-                'offset_seconds': to_seconds(offset),
-                'start_seconds': to_seconds(start),
-                'duration_seconds': to_seconds(duration),
-                'offset': offset,
-                'start': start,
-                'duration': duration
-            }
-
-            clips.append(clip_info)
+        if CLIP_NAME_PATTERN.search(attrs.get('name', '')):
+            raw_offsets.append(attrs.get('offset', '0s'))
+            raw_starts.append(attrs.get('start', '0s'))
+            raw_durations.append(attrs.get('duration', '0s'))
+
+    # Only mc-clip attributes are needed, so let expat report start tags
+    # without building any element tree
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    with open(fcpxml_path, 'rb') as f:
+        parser.ParseFile(f)
+
+    # Decode each column in one pass with a decoder fixed to the project's
+    # timebase; other time formats go through the cached generic parser
+    decode = make_time_decoder(chain(raw_offsets, raw_starts, raw_durations))
+    offsets = array('d', map(decode, raw_offsets))
+    starts = array('d', map(decode, raw_starts))
+    durations = array('d', map(decode, raw_durations))
 
     # Sort by offset
-    clips.sort(key=lambda x: x['offset_seconds'])
+    order = sorted(range(len(offsets)), key=offsets.__getitem__)
 
-    return clips
+    return {
+        'offset_seconds': array('d', map(offsets.__getitem__, order)),
+        'start_seconds': array('d', map(starts.__getitem__, order)),
+        'duration_seconds': array('d', map(durations.__getitem__, order)),
+    }
+
+def filter_clips(clips, keep):
+    """Select the clips whose entry in the boolean sequence `keep` is true."""
+    return {column: array('d', compress(values, keep)) for column, values in clips.items()}
+
+def get_distribution(durations):
+    """Bucket clip durations into <2s, 2-5s, 5-10s, 10-20s and >=20s counts in one pass."""
+    counts = [0] * (len(DISTRIBUTION_EDGES) + 1)
+    for duration in durations:
+        counts[bisect_right(DISTRIBUTION_EDGES, duration)] += 1
+    return tuple(counts)
 
 def analyze_differences():
     """Compare AI-generated cuts with manual edits."""
@@ -72,33 +151,37 @@ def analyze_differences():
     # Extract clips
     print("\n📊 Extracting clips from AI-generated FCPXML...")
     ai_clips = extract_mc_clips(ai_generated)
-    print(f"   Found {len(ai_clips)} clips")
+    print(f"   Found {len(ai_clips['duration_seconds'])} clips")
 
     print("\n📊 Extracting clips from manually edited FCPXML...")
     manual_clips = extract_mc_clips(manual_edit)
-    print(f"   Found {len(manual_clips)} clips")
+    print(f"   Found {len(manual_clips['duration_seconds'])} clips")
 
     # Filter out intro/compound clips (first few seconds)
     print("\n🔍 Filtering out intro section...")
     # Skip clips that start before 60 seconds (intro section)
-    manual_clips_filtered = [c for c in manual_clips if c['start_seconds'] > 60]
-    print(f"   Filtered to {len(manual_clips_filtered)} main content clips")
+    manual_clips_filtered = filter_clips(
+        manual_clips, [start > 60 for start in manual_clips['start_seconds']]
+    )
+    ai_count = len(ai_clips['duration_seconds'])
+    manual_count = len(manual_clips_filtered['duration_seconds'])
+    print(f"   Filtered to {manual_count} main content clips")
 
     # Statistics
     print("\n📈 STATISTICS:")
     print("-" * 40)
 
     # Total duration of kept content
-    ai_total_duration = sum(c['duration_seconds'] for c in ai_clips)
-    manual_total_duration = sum(c['duration_seconds'] for c in manual_clips_filtered)
+    ai_total_duration = sum(ai_clips['duration_seconds'])
+    manual_total_duration = sum(manual_clips_filtered['duration_seconds'])
 
     print(f"AI-generated total duration: {ai_total_duration:.1f}s ({ai_total_duration/60:.1f} min)")
     print(f"Manual edit total duration: {manual_total_duration:.1f}s ({manual_total_duration/60:.1f} min)")
     print(f"Difference: {manual_total_duration - ai_total_duration:.1f}s")
 
     # Average clip length
-    ai_avg_duration = ai_total_duration / len(ai_clips) if ai_clips else 0
-    manual_avg_duration = manual_total_duration / len(manual_clips_filtered) if manual_clips_filtered else 0
+    ai_avg_duration = ai_total_duration / ai_count if ai_count else 0
+    manual_avg_duration = manual_total_duration / manual_count if manual_count else 0
 
     print(f"\nAverage clip duration:")
     print(f"  AI-generated: {ai_avg_duration:.1f}s")
@@ -108,16 +191,8 @@ def analyze_differences():
     print("\n📊 CLIP LENGTH DISTRIBUTION:")
     print("-" * 40)
 
-    def get_distribution(clips):
-        very_short = sum(1 for c in clips if c['duration_seconds'] < 2)
-        short = sum(1 for c in clips if 2 <= c['duration_seconds'] < 5)
-        medium = sum(1 for c in clips if 5 <= c['duration_seconds'] < 10)
-        long = sum(1 for c in clips if 10 <= c['duration_seconds'] < 20)
-        very_long = sum(1 for c in clips if c['duration_seconds'] >= 20)
-        return very_short, short, medium, long, very_long
-
-    ai_dist = get_distribution(ai_clips)
-    manual_dist = get_distribution(manual_clips_filtered)
+    ai_dist = get_distribution(ai_clips['duration_seconds'])
+    manual_dist = get_distribution(manual_clips_filtered['duration_seconds'])
 
     print("                 <2s   2-5s  5-10s 10-20s  >20s")
     print(f"AI-generated:  {ai_dist[0]:4d}  {ai_dist[1]:4d}  {ai_dist[2]:5d}  {ai_dist[3]:5d}  {ai_dist[4]:4d}")
@@ -128,12 +203,13 @@ def analyze_differences():
     print("-" * 40)
 
     print("\nAI-generated clips:")
-    for i, clip in enumerate(ai_clips[:10]):
-        print(f"  {i+1:2d}. Duration: {clip['duration_seconds']:6.1f}s  Start: {clip['start_seconds']:7.1f}s")
+    for i, (duration, start) in enumerate(zip(ai_clips['duration_seconds'][:10], ai_clips['start_seconds'][:10])):
+        print(f"  {i+1:2d}. Duration: {duration:6.1f}s  Start: {start:7.1f}s")
 
     print("\nManual edit clips:")
-    for i, clip in enumerate(manual_clips_filtered[:10]):
-        print(f"  {i+1:2d}. Duration: {clip['duration_seconds']:6.1f}s  Start: {clip['start_seconds']:7.1f}s")
+    for i, (duration, start) in enumerate(zip(manual_clips_filtered['duration_seconds'][:10],
+                                              manual_clips_filtered['start_seconds'][:10])):
+        print(f"  {i+1:2d}. Duration: {duration:6.1f}s  Start: {start:7.1f}s")
 
     # Key insights
     print("\n💡 KEY INSIGHTS:")
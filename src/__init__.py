@@ -7,6 +7,14 @@ AI-powered Final Cut Pro workflow automation for cutting multicam clips.
 __version__ = "1.0.0"
 __author__ = "Payette Forward"
 
-from .core.workflow import MulticamAutoCutWorkflow
+__all__ = ["MulticamAutoCutWorkflow"]
 
-__all__ = ["MulticamAutoCutWorkflow"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Load the workflow (and its SDK dependencies) only when it is used,
+    # so entry points that just parse arguments stay fast
+    if name == "MulticamAutoCutWorkflow":
+        from .core.workflow import MulticamAutoCutWorkflow
+
+        return MulticamAutoCutWorkflow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
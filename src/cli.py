@@ -3,22 +3,177 @@
 Command Line Interface for the Multicam Auto-Cut System.
 """
 
-import argparse
+import os
 import sys
 import logging
-from pathlib import Path
-from datetime import datetime
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from functools import lru_cache
 
+from src import __version__
 from src.config import AppSettings
-from src.core import MulticamAutoCutWorkflow
-from src.utils.logging_config import setup_logging
+from src.config.settings import CLEANING_LEVELS
 
+logger = logging.getLogger(__name__)
+
+# Editing profiles selectable with --profile
+_PROFILE_CHOICES = ("scripted", "tutorial", "rough", "podcast", "aggressive")
+
+# Banner glyphs; NO_EMOJI=1 swaps them for ASCII on terminals that render
+# emoji slowly or not at all. Emoji that render narrow carry their padding.
+if os.environ.get("NO_EMOJI"):
+    _GLYPHS = {
+        "title": "*", "file": ">", "clean": "-", "edit": "-", "profile": "-",
+        "cache": "-", "done": "[OK]", "time": "-", "steps": "*", "arrow": "->",
+    }
+else:
+    _GLYPHS = {
+        "title": "🎬", "file": "📄", "clean": "🧹", "edit": "✏️ ", "profile": "📝",
+        "cache": "💾", "done": "✅", "time": "⏱️ ", "steps": "📝", "arrow": "→",
+    }
+
+# Option strings offered to shell completion (bash `complete -C`)
+_COMPLETION_WORDS = (
+    "-h", "--help", "-o", "--output", "--cleaning", "--profile", "--no-edit",
+    "--no-cache", "--keep-temp", "-j", "--jobs", "-v", "--verbose", "-V", "--version",
+)
+
+
+def _complete(comp_line: str) -> None:
+    """Print the option strings that complete the last word of `comp_line`."""
+    current = "" if comp_line.endswith(" ") else comp_line.rsplit(" ", 1)[-1]
+    for word in _COMPLETION_WORDS:
+        if word.startswith(current):
+            print(word)
+
+
+def _expand_inputs(spec: str) -> list:
+    """
+    Expand an input argument into the FCPXML files it names.
+
+    Args:
+        spec (str): A file path, a directory, or a glob pattern
+
+    Returns:
+        list: Matching paths in sorted order; a plain file path is returned as is
+    """
+    if os.path.isdir(spec):
+        import glob
+
+        return sorted(glob.glob(os.path.join(spec, "*.fcpxml")))
+    if os.path.isfile(spec):
+        return [spec]
+    if any(char in spec for char in "*?["):
+        import glob
+
+        return sorted(glob.glob(spec))
+    return [spec]
+
+
+def _process_file(input_fcpxml: str, output_file: str, temp_dir: str,
+                  workflow_options: dict, run_options: dict, verbose: bool) -> dict:
+    """
+    Run the workflow on one file; the unit of work of a batch run.
+
+    Lives at module level so a process pool can pickle it, and sets up
+    logging itself when the worker was spawned rather than forked and so
+    started without handlers. The job's temp directory belongs to this job
+    alone, so unless temp files are kept it is removed as a whole.
+    """
+    from src.core import MulticamAutoCutWorkflow
+
+    if not logging.getLogger().handlers:
+        from src.utils.logging_config import setup_logging
+
+        setup_logging(verbose=verbose)
+    try:
+        workflow = MulticamAutoCutWorkflow(temp_dir=temp_dir, **workflow_options)
+        return workflow.process_multicam_clip(
+            input_fcpxml=input_fcpxml, output_fcpxml=output_file, **run_options
+        )
+    except Exception as e:
+        return {"success": False, "input_file": input_fcpxml, "error": str(e)}
+    finally:
+        if not run_options.get("keep_temp_files"):
+            import shutil
+
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _run_batch(inputs: list, output_dir: str, settings, args) -> int:
+    """
+    Process several FCPXML files in parallel worker processes.
+
+    Each file gets its own temp directory, since a workflow's cleanup clears
+    every audio file in its temp directory. Inputs sharing a file name (such
+    as the Info.fcpxml of several bundles) get the job index in their output
+    name, so no two workers write the same output file. Transcripts cached by one worker
+    are renamed into place atomically, so workers never read a partial cache.
+
+    Returns:
+        int: Exit code; 0 only when every file succeeded
+    """
+    from collections import Counter
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    workflow_options = {
+        "cleaning_level": settings.cleaning_level,
+        "transcript_cache_dir": str(settings.transcript_cache_dir),
+        "edit_transcript": settings.edit_transcript,
+        "editing_profile": args.profile,
+    }
+    run_options = {
+        "use_cached_transcript": settings.use_transcript_cache,
+        "keep_temp_files": settings.keep_temp_files,
+    }
+    jobs = max(1, min(len(inputs), args.jobs or os.cpu_count() or 1))
+
+    g = _GLYPHS
+    sys.stdout.write(
+        f"\n{g['title']} MULTICAM AUTO-CUT SYSTEM\n{'=' * 40}\n"
+        f"{g['file']} Inputs: {len(inputs)} files ({jobs} at a time)\n"
+        f"{g['file']} Output: {output_dir}\n\n"
+    )
+    sys.stdout.flush()
+
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in inputs]
+    stem_counts = Counter(stems)
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for index, (input_fcpxml, base_name) in enumerate(zip(inputs, stems)):
+            output_name = base_name if stem_counts[base_name] == 1 else f"job{index:03d}_{base_name}"
+            output_file = os.path.join(output_dir, f"{output_name}_AutoCut.fcpxml")
+            temp_dir = os.path.join(str(settings.temp_dir), f"job{index:03d}_{base_name}")
+            future = pool.submit(
+                _process_file, input_fcpxml, output_file, temp_dir,
+                workflow_options, run_options, args.verbose,
+            )
+            futures[future] = input_fcpxml
+
+        for future in as_completed(futures):
+            input_fcpxml = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            if result.get("success"):
+                sys.stdout.write(
+                    f"{g['done']} {input_fcpxml}: {result['original_duration']:.1f}s {g['arrow']} "
+                    f"{result['final_duration']:.1f}s\n"
+                )
+            else:
+                failures += 1
+                logger.error("%s failed: %s", input_fcpxml, result.get("error", "unknown error"))
+
+    sys.stdout.write(f"\n{len(inputs) - failures}/{len(inputs)} files processed\n")
+    return 1 if failures else 0
+
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the argument parser once; later calls reuse it."""
+    import argparse
 
-def main():
-    """Main CLI entry point."""
     parser = argparse.ArgumentParser(
         description="AI-powered Final Cut Pro workflow automation for cutting multicam clips.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -28,6 +183,7 @@ Examples:
   %(prog)s input.fcpxml -o custom_output   # Custom output directory
   %(prog)s input.fcpxml --no-edit          # Skip AI transcript editing
   %(prog)s input.fcpxml --cleaning light   # Use light cleaning level
+  %(prog)s dailies/ -j 4                   # Process a folder, 4 files at a time
         """,
     )
 
@@ -35,7 +191,7 @@ Examples:
     parser.add_argument(
         "input_fcpxml",
         type=str,
-        help="Path to input FCPXML file",
+        help="Path to input FCPXML file, a directory of them, or a quoted glob",
     )
 
     # Optional arguments
@@ -49,7 +205,7 @@ Examples:
     parser.add_argument(
         "--cleaning",
         type=str,
-        choices=["light", "moderate", "aggressive"],
+        choices=CLEANING_LEVELS,
         default="moderate",
         help="Transcript cleaning level (default: moderate)",
     )
@@ -57,7 +213,7 @@ Examples:
     parser.add_argument(
         "--profile",
         type=str,
-        choices=["scripted", "tutorial", "rough", "podcast", "aggressive"],
+        choices=_PROFILE_CHOICES,
         default="tutorial",
         help="Editing profile: scripted (minimal), tutorial (balanced), rough (more cuts), podcast (conversational), aggressive (maximum cuts)",
     )
@@ -80,6 +236,13 @@ Examples:
         help="Keep temporary files after processing",
     )
 
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Files processed in parallel when given several inputs (default: CPU count)",
+    )
+
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -87,16 +250,34 @@ Examples:
     )
 
     parser.add_argument(
-        "--version",
+        "-V", "--version",
         action="version",
-        version="%(prog)s 1.0.0",
+        version=f"%(prog)s {__version__}",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    # Answer version and completion requests without building the parser
+    comp_line = os.environ.get("COMP_LINE")
+    if comp_line is not None:
+        _complete(comp_line)
+        return 0
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")
+        return 0
+
+    args = _build_parser().parse_args()
+
+    # Deferred so --help, --version and usage errors never load the workflow
+    from src.core import MulticamAutoCutWorkflow
+    from src.utils.logging_config import setup_logging
 
-    # Setup logging
+    # Setup logging; processors report progress through the root handlers,
+    # so this stays on the normal run path rather than only on errors
     setup_logging(verbose=args.verbose)
-    logger = logging.getLogger(__name__)
 
     try:
         # Load settings from environment
@@ -116,6 +297,24 @@ Examples:
 
         # Validate settings
         settings.validate()
+        settings.ensure_dirs()
+
+        inputs = _expand_inputs(args.input_fcpxml)
+        if not inputs:
+            logger.error("No FCPXML files match %s", args.input_fcpxml)
+            return 1
+
+        # Determine output path
+        if args.output:
+            output_dir = args.output
+        else:
+            from datetime import datetime
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_dir = os.path.join(settings.output_dir, timestamp)
+
+        if len(inputs) > 1:
+            return _run_batch(inputs, output_dir, settings, args)
 
         # Initialize workflow
         workflow = MulticamAutoCutWorkflow(
@@ -126,49 +325,48 @@ Examples:
             editing_profile=args.profile,
         )
 
-        # Determine output path
-        if args.output:
-            output_dir = Path(args.output)
-        else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_dir = settings.output_dir / timestamp
-
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate output filename
-        input_path = Path(args.input_fcpxml)
-        base_name = input_path.stem
-        output_file = output_dir / f"{base_name}_AutoCut.fcpxml"
+        # Generate output filename; the directory is created when the
+        # workflow writes its first output, so failed runs leave nothing behind
+        input_fcpxml = inputs[0]
+        base_name = os.path.splitext(os.path.basename(input_fcpxml))[0]
+        output_file = os.path.join(output_dir, f"{base_name}_AutoCut.fcpxml")
 
-        print("\n🎬 MULTICAM AUTO-CUT SYSTEM")
-        print("=" * 40)
-        print(f"📄 Input:  {args.input_fcpxml}")
-        print(f"📄 Output: {output_file}")
-        print(f"🧹 Cleaning Level: {settings.cleaning_level}")
-        print(f"✏️  Edit Transcript: {'Yes' if settings.edit_transcript else 'No'}")
+        # Write the banner in one call rather than one write per line
+        g = _GLYPHS
+        banner = [
+            f"\n{g['title']} MULTICAM AUTO-CUT SYSTEM",
+            "=" * 40,
+            f"{g['file']} Input:  {input_fcpxml}",
+            f"{g['file']} Output: {output_file}",
+            f"{g['clean']} Cleaning Level: {settings.cleaning_level}",
+            f"{g['edit']} Edit Transcript: {'Yes' if settings.edit_transcript else 'No'}",
+        ]
         if settings.edit_transcript:
-            print(f"📝 Editing Profile: {args.profile}")
-        print(f"💾 Use Cache: {'Yes' if settings.use_transcript_cache else 'No'}")
-        print()
+            banner.append(f"{g['profile']} Editing Profile: {args.profile}")
+        banner.append(f"{g['cache']} Use Cache: {'Yes' if settings.use_transcript_cache else 'No'}")
+        sys.stdout.write("\n".join(banner) + "\n\n")
+        sys.stdout.flush()
 
         # Process the multicam clip
         result = workflow.process_multicam_clip(
-            input_fcpxml=args.input_fcpxml,
-            output_fcpxml=str(output_file),
+            input_fcpxml=input_fcpxml,
+            output_fcpxml=output_file,
             use_cached_transcript=settings.use_transcript_cache,
             keep_temp_files=settings.keep_temp_files,
         )
 
         if result["success"]:
-            print("\n✅ Processing complete!")
-            print(f"📄 Output saved to: {result['output_file']}")
-            print(f"⏱️  Original: {result['original_duration']:.1f}s")
-            print(f"⏱️  Final: {result['final_duration']:.1f}s")
-            print(f"💾 Saved: {result['time_saved']:.1f}s ({result['time_saved_percentage']:.1f}%)")
-            print("\n📝 Next Steps:")
-            print("1. Open Final Cut Pro")
-            print("2. Import the generated FCPXML file")
-            print("3. Review and fine-tune the edits as needed")
+            sys.stdout.write(
+                f"\n{g['done']} Processing complete!\n"
+                f"{g['file']} Output saved to: {result['output_file']}\n"
+                f"{g['time']} Original: {result['original_duration']:.1f}s\n"
+                f"{g['time']} Final: {result['final_duration']:.1f}s\n"
+                f"{g['cache']} Saved: {result['time_saved']:.1f}s ({result['time_saved_percentage']:.1f}%)\n"
+                f"\n{g['steps']} Next Steps:\n"
+                "1. Open Final Cut Pro\n"
+                "2. Import the generated FCPXML file\n"
+                "3. Review and fine-tune the edits as needed\n"
+            )
             return 0
         else:
             logger.error("Processing failed")
@@ -178,7 +376,7 @@ Examples:
         print("\n\nOperation cancelled by user")
         return 130
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=args.verbose)
+        logger.error("Error: %s", e, exc_info=args.verbose)
         return 1
 
 
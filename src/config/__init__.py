@@ -1,6 +1,19 @@
 """Configuration module for the Multicam Auto-Cut System."""
 
 from .settings import AppSettings
-from .editing_profiles import EditingProfile, PROFILES, get_profile, list_profiles
 
-__all__ = ["AppSettings", "EditingProfile", "PROFILES", "get_profile", "list_profiles"]
\ No newline at end of file
+__all__ = ["AppSettings", "EditingProfile", "PROFILES", "get_profile", "list_profiles"]
+
+_EDITING_PROFILE_EXPORTS = {"EditingProfile", "PROFILES", "get_profile", "list_profiles"}
+
+
+def __getattr__(name):
+    # Resolve editing profile exports on first access so importing
+    # AppSettings alone does not load the profile prompt templates
+    if name in _EDITING_PROFILE_EXPORTS:
+        from . import editing_profiles
+
+        value = getattr(editing_profiles, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,15 @@
 Editing profiles for different recording scenarios.
 """
 
-from dataclasses import dataclass
-from typing import Dict
+from __future__ import annotations
 
-@dataclass
+from dataclasses import dataclass, field
+from string import Formatter
+from types import MappingProxyType
+
+from ..utils.compat import DATACLASS_SLOTS
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EditingProfile:
     """Configuration for different editing styles based on recording type."""
 
@@ -15,14 +20,35 @@ class EditingProfile:
     preserve_navigation: bool = True
     preserve_pauses: bool = True
     aggressive_filler_removal: bool = False
+    _prompt_prefix: str = field(init=False, repr=False, compare=False)
+    _prompt_suffix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Split the template around its single {transcript} placeholder."""
+        parts = [[], []]
+        placeholders = 0
+        for literal, field_name, _, _ in Formatter().parse(self.prompt_template):
+            parts[min(placeholders, 1)].append(literal)
+            if field_name is None:
+                continue
+            if field_name != "transcript":
+                raise ValueError(f"Unknown placeholder {{{field_name}}} in profile '{self.name}'")
+            placeholders += 1
+        if placeholders != 1:
+            raise ValueError(
+                f"Profile '{self.name}' must contain exactly one {{transcript}} placeholder"
+            )
+        # Frozen instance: bypass the generated __setattr__
+        object.__setattr__(self, "_prompt_prefix", "".join(parts[0]))
+        object.__setattr__(self, "_prompt_suffix", "".join(parts[1]))
 
     def get_prompt(self, transcript: str) -> str:
         """Generate the editing prompt for this profile."""
-        return self.prompt_template.format(transcript=transcript)
+        return self._prompt_prefix + transcript + self._prompt_suffix
 
 
-# Pre-defined editing profiles
-PROFILES: Dict[str, EditingProfile] = {
+# Pre-defined editing profiles (read-only view)
+PROFILES: MappingProxyType[str, EditingProfile] = MappingProxyType({
     "scripted": EditingProfile(
         name="Scripted Recording",
         description="For recordings with a prepared script. Minimal editing, preserve performance.",
@@ -166,16 +192,21 @@ Return ONLY the cleaned transcript text.""",
         preserve_pauses=False,
         aggressive_filler_removal=True
     )
-}
+})
+
+# Case-insensitive lookup table and the fallback profile
+_PROFILES_BY_LOWER_NAME: MappingProxyType[str, EditingProfile] = MappingProxyType({
+    name.lower(): profile for name, profile in PROFILES.items()
+})
+_DEFAULT_PROFILE = PROFILES["tutorial"]
 
 def get_profile(name: str) -> EditingProfile:
-    """Get an editing profile by name."""
-    profile = PROFILES.get(name.lower())
-    if not profile:
-        # Default to tutorial profile
-        return PROFILES["tutorial"]
-    return profile
-
-def list_profiles() -> Dict[str, str]:
+    """Get an editing profile by name, defaulting to the tutorial profile."""
+    # CLI choices are already lowercase, so skip building a lowered copy
+    if not name.islower():
+        name = name.lower()
+    return _PROFILES_BY_LOWER_NAME.get(name, _DEFAULT_PROFILE)
+
+def list_profiles() -> dict[str, str]:
     """List available profiles with descriptions."""
     return {name: profile.description for name, profile in PROFILES.items()}
\ No newline at end of file
@@ -2,18 +2,59 @@
 Configuration settings for the Multicam Auto-Cut System.
 """
 
+from __future__ import annotations
+
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 from dataclasses import dataclass
 
-@dataclass
+from ..utils.compat import DATACLASS_SLOTS
+
+# Accepted transcript cleaning levels
+CLEANING_LEVELS = ("light", "moderate", "aggressive")
+
+# Environment values accepted as boolean true
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _as_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() in _TRUE_VALUES
+
+
+@lru_cache(maxsize=1)
+def _env_values() -> dict[str, object]:
+    """
+    Read and parse the settings environment variables once per process.
+
+    Call ``_env_values.cache_clear()`` after changing the environment to
+    have the next ``AppSettings.from_env()`` pick the new values up.
+    """
+    env = os.environ
+    return dict(
+        openai_api_key=env.get("OPENAI_API_KEY"),
+        anthropic_api_key=env.get("ANTHROPIC_API_KEY"),
+        temp_dir=Path(env.get("TEMP_DIR", "./temp")),
+        transcript_cache_dir=Path(env.get("TRANSCRIPT_CACHE_DIR", "./transcripts")),
+        output_dir=Path(env.get("OUTPUT_DIR", "./outputs")),
+        cleaning_level=env.get("CLEANING_LEVEL", "moderate"),
+        use_transcript_cache=_as_bool(env.get("USE_TRANSCRIPT_CACHE", "true")),
+        edit_transcript=_as_bool(env.get("EDIT_TRANSCRIPT", "true")),
+        transcription_model=env.get("TRANSCRIPTION_MODEL", "auto"),
+        keep_temp_files=_as_bool(env.get("KEEP_TEMP_FILES", "false")),
+        save_debug_transcript=_as_bool(env.get("SAVE_DEBUG_TRANSCRIPT", "true")),
+        verbose_logging=_as_bool(env.get("VERBOSE_LOGGING", "false")),
+    )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AppSettings:
     """Application-wide settings."""
 
     # API Keys
-    openai_api_key: Optional[str] = None
-    anthropic_api_key: Optional[str] = None
+    openai_api_key: str | None = None
+    anthropic_api_key: str | None = None
 
     # Directories
     temp_dir: Path = Path("./temp")
@@ -41,21 +82,13 @@ class AppSettings:
 
     @classmethod
     def from_env(cls) -> "AppSettings":
-        """Create settings from environment variables."""
-        return cls(
-            openai_api_key=os.getenv("OPENAI_API_KEY"),
-            anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
-            temp_dir=Path(os.getenv("TEMP_DIR", "./temp")),
-            transcript_cache_dir=Path(os.getenv("TRANSCRIPT_CACHE_DIR", "./transcripts")),
-            output_dir=Path(os.getenv("OUTPUT_DIR", "./outputs")),
-            cleaning_level=os.getenv("CLEANING_LEVEL", "moderate"),
-            use_transcript_cache=os.getenv("USE_TRANSCRIPT_CACHE", "true").lower() == "true",
-            edit_transcript=os.getenv("EDIT_TRANSCRIPT", "true").lower() == "true",
-            transcription_model=os.getenv("TRANSCRIPTION_MODEL", "auto"),
-            keep_temp_files=os.getenv("KEEP_TEMP_FILES", "false").lower() == "true",
-            save_debug_transcript=os.getenv("SAVE_DEBUG_TRANSCRIPT", "true").lower() == "true",
-            verbose_logging=os.getenv("VERBOSE_LOGGING", "false").lower() == "true",
-        )
+        """
+        Create settings from environment variables.
+
+        The environment is parsed once per process; each call returns a new
+        instance, so callers may override fields without affecting others.
+        """
+        return cls(**_env_values())
 
     def validate(self) -> None:
         """Validate settings and raise errors if invalid."""
@@ -65,10 +98,12 @@ class AppSettings:
         if self.edit_transcript and not self.anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY is required when transcript editing is enabled")
 
-        if self.cleaning_level not in ["light", "moderate", "aggressive"]:
+        if self.cleaning_level not in CLEANING_LEVELS:
             raise ValueError(f"Invalid cleaning level: {self.cleaning_level}")
 
-        # Create directories if they don't exist
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
-        self.transcript_cache_dir.mkdir(parents=True, exist_ok=True)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+    def ensure_dirs(self) -> None:
+        """Create the working directories that don't exist yet."""
+        for path in (self.temp_dir, self.transcript_cache_dir, self.output_dir):
+            # One stat for the common case where the directory already exists
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
\ No newline at end of file
@@ -11,7 +11,9 @@ import json
 import hashlib
 import sys
 from pathlib import Path
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 # Load environment variables from .env file
@@ -25,14 +27,13 @@ try:
 except ImportError:
     pass  # dotenv not installed, will use system environment variables
 
-# Import our modules
+# Import our modules; Transcriber and TranscriptEditor are imported where
+# they are first needed, since demo and --no-edit runs never use them
 from ..processors import (
     FCPXMLParser,
     AudioExtractor,
-    Transcriber,
     TranscriptCleaner,
-    CutGenerator,
-    TranscriptEditor
+    CutGenerator
 )
 
 # Set up enhanced logging
@@ -61,6 +62,125 @@ except ImportError:
     )
     logger = logging.getLogger(__name__)
 
+# Cache-key hashing: BLAKE3 (SIMD, multithreaded) when installed, otherwise
+# the standard library's BLAKE2b, which still outruns MD5 on 64-bit CPUs
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# Faster transcript cache (de)serialization when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compressed transcript cache (.json.zst) when zstandard is installed
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# zstd level for the transcript cache; level 3 already shrinks the JSON
+# several-fold and decompresses faster than the disk can supply it
+_CACHE_ZSTD_LEVEL = 3
+
+# Sample rate of the demo's one-second silent WAV
+_DUMMY_AUDIO_RATE = 16000
+
+# Bytes of file content mixed into a media fingerprint
+_FINGERPRINT_HEAD_SIZE = 64 * 1024
+
+# Demo transcript, built once: full text and (start, end, text) segments
+_DEMO_TRANSCRIPT_TEXT = (
+    "So, um, today we're going to talk about, uh, the new features in our product. "
+    "You know, like, the thing is, we've been working really hard on this. "
+    "Uh, basically, what we've done is, um, we've improved the user interface. "
+    "And, like, the performance is, you know, much better now. "
+    "So, uh, let me show you the first feature. "
+    "Um, this is the new dashboard, and, uh, it's really intuitive. "
+    "You know, users can now, like, access everything from one place. "
+    "Uh, the second thing is, um, we've added real-time collaboration. "
+    "So, like, multiple people can work on the same project simultaneously. "
+    "And, uh, finally, we've improved the search functionality. "
+    "It's, you know, much faster and more accurate now."
+)
+_DEMO_SEGMENTS = (
+    (0.0, 2.5, "So, um, today we're going to talk about,"),
+    (2.5, 5.0, " uh, the new features in our product."),
+    (5.0, 6.5, " You know, like, the thing is,"),
+    (6.5, 9.0, " we've been working really hard on this."),
+    (9.0, 11.0, " Uh, basically, what we've done is,"),
+    (11.0, 13.5, " um, we've improved the user interface."),
+    (13.5, 14.5, " And, like,"),
+    (14.5, 17.0, " the performance is, you know, much better now."),
+    (17.0, 19.5, " So, uh, let me show you the first feature."),
+    (19.5, 21.0, " Um, this is the new dashboard,"),
+    (21.0, 23.5, " and, uh, it's really intuitive."),
+    (23.5, 24.5, " You know,"),
+    (24.5, 27.0, " users can now, like, access everything from one place."),
+    (27.0, 28.5, " Uh, the second thing is,"),
+    (28.5, 31.0, " um, we've added real-time collaboration."),
+    (31.0, 31.5, " So, like,"),
+    (31.5, 35.0, " multiple people can work on the same project simultaneously."),
+    (35.0, 36.0, " And, uh,"),
+    (36.0, 38.5, " finally, we've improved the search functionality."),
+    (38.5, 39.5, " It's, you know,"),
+    (39.5, 42.0, " much faster and more accurate now."),
+)
+
+
+@lru_cache(maxsize=4)
+def _shared_transcriber(method: str, api_key: Optional[str] = None):
+    """
+    Create a transcriber once per (method, API key) for the whole process.
+
+    Workflows built one after another (batch runs, the demo) then share one
+    OpenAI client and its keep-alive connection pool, or one loaded local
+    Whisper model, instead of paying the TLS handshake or model load per file.
+
+    Args:
+        method (str): 'api' or 'local'
+        api_key (str, optional): OpenAI API key; None reads OPENAI_API_KEY
+
+    Returns:
+        Transcriber: Shared transcriber instance
+    """
+    from ..processors import Transcriber
+
+    return Transcriber(api_key=api_key, method=method)
+
+
+@lru_cache(maxsize=256)
+def _fingerprint_digest(abs_path: str, size: int, mtime_ns: int) -> str:
+    """
+    Hash a file's identity and first 64 KB into a cache key.
+
+    Memoized on (path, size, mtime), so repeated lookups for an unchanged
+    file skip the read, while a modified file misses and is hashed afresh.
+
+    Args:
+        abs_path (str): Absolute path of the file
+        size (int): File size in bytes
+        mtime_ns (int): Modification time in nanoseconds
+
+    Returns:
+        str: Algorithm tag and hex digest, e.g. "b3_..."
+    """
+    with open(abs_path, "rb") as f:
+        head = f.read(_FINGERPRINT_HEAD_SIZE)
+
+    if _blake3 is not None:
+        hasher, tag = _blake3(), "b3"
+    else:
+        hasher, tag = hashlib.blake2b(digest_size=32), "b2"
+    hasher.update(abs_path.encode("utf-8", "surrogateescape") + b"\0")
+    hasher.update(size.to_bytes(8, "little"))
+    hasher.update(mtime_ns.to_bytes(8, "little"))
+    hasher.update(head)
+    return f"{tag}_{hasher.hexdigest()}"
+
+
 class MulticamAutoCutWorkflow:
     """
     Complete workflow orchestrator for the multicam auto-cut system.
@@ -86,7 +206,7 @@ class MulticamAutoCutWorkflow:
 
         # Initialize modules
         self.parser = FCPXMLParser()
-        self.audio_extractor = AudioExtractor(temp_dir)
+        self.audio_extractor = AudioExtractor(temp_dir, reuse_extraction_info=True)
         self.transcriber = None  # Will be initialized based on method
         self.cleaner = TranscriptCleaner(cleaning_level)
         self.cut_generator = CutGenerator()
@@ -96,6 +216,8 @@ class MulticamAutoCutWorkflow:
         self.editing_profile = editing_profile
         if self.edit_transcript:
             try:
+                from ..processors import TranscriptEditor
+
                 self.transcript_editor = TranscriptEditor(editing_profile=editing_profile)
                 logger.info(f"✅ Transcript editing enabled with '{editing_profile}' profile")
             except ValueError as e:
@@ -105,31 +227,56 @@ class MulticamAutoCutWorkflow:
         logger.info(f"Workflow initialized with {cleaning_level} cleaning level")
         logger.info(f"Transcript cache directory: {self.transcript_cache_dir}")
 
-    def _get_file_hash(self, file_path: str) -> str:
-        """Generate a hash for a file to use as cache key."""
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-
-    def _get_transcript_cache_path(self, audio_file: str) -> Path:
-        """Get the cache path for a transcript based on audio file hash."""
-        file_hash = self._get_file_hash(audio_file)
-        cache_filename = f"transcript_{file_hash}.json"
+    def _get_file_fingerprint(self, file_path: str) -> str:
+        """
+        Fingerprint a file from its path, size, mtime and first 64 KB.
+
+        Costs one stat, plus one small read the first time a given version
+        of the file is seen in this process. The digest is prefixed with the
+        algorithm tag ("b3" or "b2") so keys from different algorithms never
+        collide.
+        """
+        stat = os.stat(file_path)
+        return _fingerprint_digest(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+    def _get_transcript_cache_path(self, source_media: str) -> Path:
+        """
+        Get the cache path for a transcript of a source media file.
+
+        The key comes from the source media rather than the extracted audio:
+        extraction rewrites its output on every run (new mtime) and the Ogg
+        muxer picks a random stream serial, so the extracted file never
+        produces a stable key.
+        """
+        fingerprint = self._get_file_fingerprint(source_media)
+        cache_filename = f"transcript_{fingerprint}.json"
+        if zstandard is not None:
+            cache_filename += ".zst"
         return self.transcript_cache_dir / cache_filename
 
     def _load_cached_transcript(self, cache_path: Path) -> Optional[Dict]:
-        """Load a cached transcript if it exists."""
+        """
+        Load a cached transcript if it exists.
+
+        A missing `.json.zst` cache falls back to a plain `.json` cache
+        written before compression was available.
+        """
+        if not cache_path.exists() and cache_path.suffix == '.zst':
+            cache_path = cache_path.with_suffix('')
         if cache_path.exists():
             try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.info(f"✅ Loaded cached transcript from {cache_path.name}")
-                    logger.info(f"   Created: {data.get('timestamp', 'Unknown')}")
+                with open(cache_path, 'rb') as f:
+                    raw = f.read()
+                    if cache_path.suffix == '.zst':
+                        if zstandard is None:
+                            raise RuntimeError("zstandard is not installed")
+                        raw = zstandard.ZstdDecompressor().decompress(raw)
+                    data = orjson.loads(raw) if orjson else json.loads(raw)
+                    logger.info("✅ Loaded cached transcript from %s", cache_path.name)
+                    logger.info("   Created: %s", data.get('timestamp', 'Unknown'))
                     return data['transcript']
             except Exception as e:
-                logger.warning(f"Failed to load cached transcript: {e}")
+                logger.warning("Failed to load cached transcript: %s", e)
         return None
 
     def _save_transcript_cache(self, cache_path: Path, transcript: Dict, audio_file: str):
@@ -140,8 +287,30 @@ class MulticamAutoCutWorkflow:
                 'audio_file': audio_file,
                 'transcript': transcript
             }
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            compress = cache_path.suffix == '.zst' and zstandard is not None
+            # Indentation only helps a human reading the plain cache
+            if orjson:
+                option = 0 if compress else orjson.OPT_INDENT_2
+                payload = orjson.dumps(cache_data, option=option)
+            else:
+                indent = None if compress else 2
+                payload = json.dumps(cache_data, indent=indent, ensure_ascii=False).encode('utf-8')
+            if compress:
+                payload = zstandard.ZstdCompressor(level=_CACHE_ZSTD_LEVEL).compress(payload)
+            # Write to a uniquely named sibling temp file and rename it into
+            # place, so neither an interrupted write nor a concurrent writer
+            # of the same cache ever leaves a truncated cache behind
+            fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix='.tmp')
+            tmp_path = Path(tmp_name)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
             logger.info(f"💾 Transcript cached to {cache_path.name}")
         except Exception as e:
             logger.warning(f"Failed to cache transcript: {e}")
@@ -168,13 +337,15 @@ class MulticamAutoCutWorkflow:
             Dict: Results and statistics from the processing
         """
         logger.info("🚀 Starting multicam auto-cut workflow...")
-        logger.info(f"Input: {input_fcpxml}")
-        logger.info(f"Output: {output_fcpxml}")
+        logger.info("Input: %s", input_fcpxml)
+        logger.info("Output: %s", output_fcpxml)
 
         try:
             # Phase 1: Parse FCPXML
             logger.info("📄 Phase 1: Parsing FCPXML...")
-            fcpxml_data = self.parser.parse_fcpxml(input_fcpxml)
+            # Only the resources and the timeline holding the multicam clip
+            # matter here; the cut generator re-reads the full file itself
+            fcpxml_data = self.parser.parse_fcpxml(input_fcpxml, stop_after_timeline=True)
 
             # Validate multicam structure
             if not fcpxml_data['multicam_clips']:
@@ -185,51 +356,64 @@ class MulticamAutoCutWorkflow:
             if not mono_track:
                 raise ValueError("No mono audio track found - lav mic required")
 
-            logger.info(f"✅ Found multicam clip with mono track: {mono_track['name']}")
+            logger.info("✅ Found multicam clip with mono track: %s", mono_track['name'])
 
-            # Phase 2: Extract Audio
-            logger.info("🎵 Phase 2: Extracting audio...")
-            try:
-                extracted_audio_path = self.audio_extractor.extract_audio_from_multicam(
-                    fcpxml_data, mono_track
-                )
+            source_media = self.audio_extractor.get_source_path(mono_track)
+            if not os.path.exists(source_media):
+                raise FileNotFoundError(f"Source audio file not found: {source_media}")
 
-                # Validate audio
-                is_valid, message = self.audio_extractor.validate_audio_for_whisper(extracted_audio_path)
-                if not is_valid:
-                    raise ValueError(f"Audio validation failed: {message}")
-
-                logger.info(f"✅ Audio extracted and validated: {Path(extracted_audio_path).name}")
+            # The cache key comes from the source media, so look the transcript
+            # up first; a hit makes audio extraction unnecessary
+            transcription = None
+            cache_path = None
+            if transcription_method != 'demo':
+                cache_path = self._get_transcript_cache_path(source_media)
+                if use_cached_transcript and not force_retranscribe:
+                    transcription = self._load_cached_transcript(cache_path)
+                    if transcription:
+                        logger.info("💰 Using cached transcript (avoiding API call)")
 
-            except Exception as e:
-                logger.error(f"Audio extraction failed: {e}")
-                raise  # Don't fall back to dummy file, let the error propagate
+            # Phase 2: Extract Audio
+            extracted_audio_path = None
+            audio_data = None
+            if transcription is None:
+                logger.info("🎵 Phase 2: Extracting audio...")
+                # API uploads can come straight from memory; keep the temp file
+                # only when it is wanted afterwards or local Whisper needs a path
+                in_memory = transcription_method == 'api' and not keep_temp_files
+                with ThreadPoolExecutor(max_workers=1) as pool:
+                    extraction = pool.submit(
+                        self._extract_audio, fcpxml_data, mono_track, source_media, in_memory
+                    )
+                    # Load the transcription client while ffmpeg runs
+                    if transcription_method != 'demo':
+                        try:
+                            self._get_transcriber(transcription_method, api_key)
+                        except Exception as e:
+                            # Reported by _perform_transcription when it retries
+                            logger.debug("Transcriber setup deferred: %s", e)
+                    extracted_audio_path, audio_data = extraction.result()
+            else:
+                logger.info("🎵 Phase 2: Skipped, transcript already cached")
 
             # Phase 3: Transcription
-            logger.info(f"🎤 Phase 3: Transcribing audio ({transcription_method})...")
+            logger.info("🎤 Phase 3: Transcribing audio (%s)...", transcription_method)
 
             if transcription_method == 'demo':
                 # Create demo transcript for testing
                 transcription = self._create_demo_transcript()
                 logger.info("Using demo transcript")
-            else:
-                # Check for cached transcript
-                cache_path = self._get_transcript_cache_path(extracted_audio_path)
-                transcription = None
-
-                if use_cached_transcript and not force_retranscribe:
-                    transcription = self._load_cached_transcript(cache_path)
-                    if transcription:
-                        logger.info("💰 Using cached transcript (avoiding API call)")
-                        # Auto-accept cached transcript in non-interactive mode
-                        transcription = transcription
-
-                if transcription is None:
-                    transcription = self._perform_transcription(
-                        extracted_audio_path, transcription_method, api_key
-                    )
-                    # Save to cache
-                    self._save_transcript_cache(cache_path, transcription, extracted_audio_path)
+            elif transcription is None:
+                transcription = self._perform_transcription(
+                    extracted_audio_path, transcription_method, api_key,
+                    audio_data=audio_data,
+                    audio_name=f"{Path(source_media).stem}_extracted.ogg",
+                )
+                # Save to cache
+                self._save_transcript_cache(
+                    cache_path, transcription, extracted_audio_path or source_media
+                )
+            audio_data = None  # Release the encoded audio before later phases
 
             # Phase 4: Clean Transcript
             logger.info("✨ Phase 4: Cleaning transcript...")
@@ -240,10 +424,10 @@ class MulticamAutoCutWorkflow:
 
             # Log cleaning statistics
             stats = cleaned_result['cleaning_stats']
-            logger.info(f"✅ Cleaning complete:")
-            logger.info(f"   Segments: {stats['original_segment_count']} → {stats['cleaned_segment_count']}")
-            logger.info(f"   Duration: {stats['original_duration']:.1f}s → {stats['cleaned_duration']:.1f}s")
-            logger.info(f"   Time saved: {stats['time_saved']:.1f}s ({stats['time_saved_percentage']:.1f}%)")
+            logger.info("✅ Cleaning complete:")
+            logger.info("   Segments: %s → %s", stats['original_segment_count'], stats['cleaned_segment_count'])
+            logger.info("   Duration: %.1fs → %.1fs", stats['original_duration'], stats['cleaned_duration'])
+            logger.info("   Time saved: %.1fs (%.1f%%)", stats['time_saved'], stats['time_saved_percentage'])
 
             # Phase 5: Edit Transcript (if enabled)
             edited_segments = None
@@ -267,10 +451,10 @@ class MulticamAutoCutWorkflow:
                         # Log editing statistics
                         kept_count = sum(1 for s in edited_segments if s.get('keep', False))
                         removed_count = len(segments) - kept_count
-                        logger.info(f"📊 Edited transcript: keeping {kept_count}/{len(segments)} segments")
-                        logger.info(f"   Removed {removed_count} segments with stutters/false starts")
+                        logger.info("📊 Edited transcript: keeping %d/%d segments", kept_count, len(segments))
+                        logger.info("   Removed %d segments with stutters/false starts", removed_count)
                 except Exception as e:
-                    logger.warning(f"Transcript editing failed, using unedited version: {e}")
+                    logger.warning("Transcript editing failed, using unedited version: %s", e)
                     edited_segments = None
 
             # Phase 6: Generate Cuts
@@ -302,92 +486,130 @@ class MulticamAutoCutWorkflow:
             return result
 
         except Exception as e:
-            logger.error(f"❌ Workflow failed: {e}")
+            logger.error("❌ Workflow failed: %s", e)
             raise
 
-    def _perform_transcription(self, audio_path: str, method: str, api_key: Optional[str] = None) -> Dict:
+    def _extract_audio(self, fcpxml_data: Dict, mono_track: Dict, source_media: str,
+                       in_memory: bool) -> Tuple[Optional[str], Optional[bytes]]:
+        """
+        Extract and validate the mono track's audio.
+
+        Args:
+            fcpxml_data (Dict): Parsed FCPXML data
+            mono_track (Dict): Mono audio track information
+            source_media (str): Resolved path of the track's source media
+            in_memory (bool): Return encoded bytes instead of writing a temp file
+
+        Returns:
+            Tuple[Optional[str], Optional[bytes]]: (extracted file path, audio bytes);
+            exactly one of the two is set
+        """
+        try:
+            if in_memory:
+                audio_data = self.audio_extractor.extract_audio_to_bytes(fcpxml_data, mono_track)
+                if not audio_data:
+                    raise ValueError("Audio validation failed: ffmpeg produced no audio")
+                logger.info(f"✅ Audio extracted to memory from {Path(source_media).name}")
+                return None, audio_data
+
+            extracted_audio_path = self.audio_extractor.extract_audio_from_multicam(
+                fcpxml_data, mono_track
+            )
+
+            # Validate audio
+            is_valid, message = self.audio_extractor.validate_audio_for_whisper(extracted_audio_path)
+            if not is_valid:
+                raise ValueError(f"Audio validation failed: {message}")
+
+            logger.info(f"✅ Audio extracted and validated: {Path(extracted_audio_path).name}")
+            return extracted_audio_path, None
+
+        except Exception as e:
+            logger.error(f"Audio extraction failed: {e}")
+            raise  # Don't fall back to dummy file, let the error propagate
+
+    def _get_transcriber(self, method: str, api_key: Optional[str] = None):
+        """Fetch the process-wide transcriber on first use and return it."""
+        if self.transcriber is None:
+            self.transcriber = _shared_transcriber(
+                'api' if method == 'api' else 'local', api_key
+            )
+        return self.transcriber
+
+    def _perform_transcription(self, audio_path: Optional[str], method: str, api_key: Optional[str] = None,
+                               audio_data: Optional[bytes] = None, audio_name: str = "audio.ogg") -> Dict:
         """
         Perform audio transcription using the specified method.
 
         Args:
-            audio_path (str): Path to audio file
+            audio_path (str, optional): Path to audio file; unused when audio_data is given
             method (str): 'api' or 'local'
             api_key (str, optional): OpenAI API key for API method
+            audio_data (bytes, optional): Encoded audio held in memory
+            audio_name (str): Upload filename for in-memory audio
 
         Returns:
             Dict: Transcription result with segments and text
         """
         try:
             # Initialize transcriber if needed
-            if self.transcriber is None:
-                self.transcriber = Transcriber(
-                    api_key=api_key,
-                    method='api' if method == 'api' else 'local'
-                )
+            self._get_transcriber(method, api_key)
 
             logger.info("🎙️ Calling transcription API...")
             # Perform transcription
-            result = self.transcriber.transcribe_audio(
-                audio_path=audio_path,
-                language='en',
-                response_format='verbose_json'
-            )
+            if audio_data is not None:
+                result = self.transcriber.transcribe_audio_bytes(
+                    audio_data,
+                    filename=audio_name,
+                    language='en',
+                    response_format='verbose_json'
+                )
+            else:
+                result = self.transcriber.transcribe_audio(
+                    audio_path=audio_path,
+                    language='en',
+                    response_format='verbose_json'
+                )
 
-            logger.info(f"✅ Transcription successful: {len(result.get('segments', []))} segments")
+            logger.info("✅ Transcription successful: %d segments", len(result.get('segments', [])))
             return result
 
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
+            logger.error("Transcription failed: %s", e)
             if method == 'api':
                 logger.info("💡 Tip: Check your OpenAI API key or try 'demo' mode")
             raise
 
     def _create_demo_transcript(self) -> Dict:
         """Create a realistic demo transcript for testing without API calls."""
+        # Fresh dicts each call: downstream phases annotate the transcript in place
         return {
-            "text": "So, um, today we're going to talk about, uh, the new features in our product. "
-                   "You know, like, the thing is, we've been working really hard on this. "
-                   "Uh, basically, what we've done is, um, we've improved the user interface. "
-                   "And, like, the performance is, you know, much better now. "
-                   "So, uh, let me show you the first feature. "
-                   "Um, this is the new dashboard, and, uh, it's really intuitive. "
-                   "You know, users can now, like, access everything from one place. "
-                   "Uh, the second thing is, um, we've added real-time collaboration. "
-                   "So, like, multiple people can work on the same project simultaneously. "
-                   "And, uh, finally, we've improved the search functionality. "
-                   "It's, you know, much faster and more accurate now.",
+            "text": _DEMO_TRANSCRIPT_TEXT,
             "segments": [
-                {"id": 0, "start": 0.0, "end": 2.5, "text": "So, um, today we're going to talk about,"},
-                {"id": 1, "start": 2.5, "end": 5.0, "text": " uh, the new features in our product."},
-                {"id": 2, "start": 5.0, "end": 6.5, "text": " You know, like, the thing is,"},
-                {"id": 3, "start": 6.5, "end": 9.0, "text": " we've been working really hard on this."},
-                {"id": 4, "start": 9.0, "end": 11.0, "text": " Uh, basically, what we've done is,"},
-                {"id": 5, "start": 11.0, "end": 13.5, "text": " um, we've improved the user interface."},
-                {"id": 6, "start": 13.5, "end": 14.5, "text": " And, like,"},
-                {"id": 7, "start": 14.5, "end": 17.0, "text": " the performance is, you know, much better now."},
-                {"id": 8, "start": 17.0, "end": 19.5, "text": " So, uh, let me show you the first feature."},
-                {"id": 9, "start": 19.5, "end": 21.0, "text": " Um, this is the new dashboard,"},
-                {"id": 10, "start": 21.0, "end": 23.5, "text": " and, uh, it's really intuitive."},
-                {"id": 11, "start": 23.5, "end": 24.5, "text": " You know,"},
-                {"id": 12, "start": 24.5, "end": 27.0, "text": " users can now, like, access everything from one place."},
-                {"id": 13, "start": 27.0, "end": 28.5, "text": " Uh, the second thing is,"},
-                {"id": 14, "start": 28.5, "end": 31.0, "text": " um, we've added real-time collaboration."},
-                {"id": 15, "start": 31.0, "end": 31.5, "text": " So, like,"},
-                {"id": 16, "start": 31.5, "end": 35.0, "text": " multiple people can work on the same project simultaneously."},
-                {"id": 17, "start": 35.0, "end": 36.0, "text": " And, uh,"},
-                {"id": 18, "start": 36.0, "end": 38.5, "text": " finally, we've improved the search functionality."},
-                {"id": 19, "start": 38.5, "end": 39.5, "text": " It's, you know,"},
-                {"id": 20, "start": 39.5, "end": 42.0, "text": " much faster and more accurate now."}
+                {"id": i, "start": start, "end": end, "text": text}
+                for i, (start, end, text) in enumerate(_DEMO_SEGMENTS)
             ],
             "language": "en",
-            "duration": 42.0
+            "duration": _DEMO_SEGMENTS[-1][1]
         }
 
     def _create_dummy_audio_file(self) -> str:
-        """Create a dummy audio file for demo purposes."""
+        """
+        Create a dummy audio file for demo purposes.
+
+        The file is one second of 16 kHz mono silence with a proper WAV
+        header, so tools that read it (ffprobe, Whisper validation) accept
+        it. It is written once per temp directory and reused afterwards.
+        """
         dummy_path = self.temp_dir / "dummy_audio.wav"
-        # Create an empty file
-        dummy_path.touch()
+        if not dummy_path.exists():
+            import wave
+
+            with wave.open(str(dummy_path), 'wb') as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(_DUMMY_AUDIO_RATE)
+                wav.writeframes(bytes(2 * _DUMMY_AUDIO_RATE))
         return str(dummy_path)
 
 def demo_workflow():
@@ -467,11 +689,8 @@ def demo_workflow():
         print("=" * 50 + "\n")
 
     # Cleanup demo files
-    try:
-        os.remove(input_file)
-        print("Demo files cleaned up.")
-    except:
-        pass
+    Path(input_file).unlink(missing_ok=True)
+    print("Demo files cleaned up.")
 
     return result
 
@@ -633,9 +852,8 @@ Examples:
 
     return 0
 
-def create_sample_fcpxml_for_testing(output_path: str = "test_multicam.fcpxml"):
-    """Create a comprehensive sample FCPXML file for testing."""
-    sample_fcpxml = '''<?xml version="1.0" encoding="UTF-8"?>
+# Sample multicam project written by create_sample_fcpxml_for_testing, encoded once
+_SAMPLE_FCPXML_BYTES = '''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE fcpxml>
 <fcpxml version="1.9">
     <resources>
@@ -681,10 +899,17 @@ def create_sample_fcpxml_for_testing(output_path: str = "test_multicam.fcpxml"):
             </spine>
         </sequence>
     </project>
-</fcpxml>'''
+</fcpxml>'''.encode('utf-8')
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(sample_fcpxml)
+
+def create_sample_fcpxml_for_testing(output_path: str = "test_multicam.fcpxml"):
+    """Create a comprehensive sample FCPXML file for testing."""
+    # Already-encoded bytes go straight to the file descriptor
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, _SAMPLE_FCPXML_BYTES)
+    finally:
+        os.close(fd)
 
     logger.info(f"Sample FCPXML created: {output_path}")
     return output_path
@@ -713,11 +938,8 @@ def run_complete_workflow_demo():
     )
 
     # Cleanup demo files
-    try:
-        os.remove(sample_input)
-        logger.info("Demo input file cleaned up")
-    except:
-        pass
+    Path(sample_input).unlink(missing_ok=True)
+    logger.info("Demo input file cleaned up")
 
     return result
 
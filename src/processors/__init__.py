@@ -1,12 +1,5 @@
 """Processing modules for various stages of the workflow."""
 
-from .fcpxml_parser import FCPXMLParser
-from .audio_extractor import AudioExtractor
-from .transcriber import Transcriber
-from .transcript_cleaner import TranscriptCleaner
-from .transcript_editor import TranscriptEditor
-from .cut_generator import CutGenerator
-
 __all__ = [
     "FCPXMLParser",
     "AudioExtractor",
@@ -14,4 +7,26 @@ __all__ = [
     "TranscriptCleaner",
     "TranscriptEditor",
     "CutGenerator",
-]
\ No newline at end of file
+]
+
+# Exported name -> submodule; each is imported on first access so callers
+# only load the processors (and dependencies) they actually use
+_PROCESSOR_MODULES = {
+    "FCPXMLParser": "fcpxml_parser",
+    "AudioExtractor": "audio_extractor",
+    "Transcriber": "transcriber",
+    "TranscriptCleaner": "transcript_cleaner",
+    "TranscriptEditor": "transcript_editor",
+    "CutGenerator": "cut_generator",
+}
+
+
+def __getattr__(name):
+    module_name = _PROCESSOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -4,30 +4,58 @@ Handles extracting specific audio tracks from multicam clips and preparing them
 """
 
 import os
+import re
 import subprocess
 import tempfile
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import unquote
 
+try:
+    import orjson as _json  # Faster parsing of ffprobe output
+except ImportError:
+    import json as _json
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Result of the ffmpeg availability probe, shared by all extractor instances
+_FFMPEG_AVAILABLE: Optional[bool] = None
+
+# Stream information printed by ffmpeg on stderr during extraction
+_FFMPEG_DURATION_PATTERN = re.compile(r'Duration: (\d+):(\d\d):(\d\d(?:\.\d+)?)')
+_FFMPEG_AUDIO_STREAM_PATTERN = re.compile(
+    r'Stream #\d+:\d+.*?: Audio: (\w+).*?, (\d+) Hz, (mono|stereo|\d+ channels)'
+)
+
+# file:// scheme and localhost host prefix of FCPXML media URLs
+_FILE_URL_PREFIX_PATTERN = re.compile(r'^(?:file://)?(?:localhost(?=/))?')
+
+# Number of trailing ffmpeg stderr lines kept for error reporting
+_STDERR_TAIL_LINES = 50
+
 class AudioExtractor:
     """
     Extracts and processes audio from multicam clips for transcription.
     """
     
-    def __init__(self, temp_dir: str = "./temp"):
+    def __init__(self, temp_dir: str = "./temp", reuse_extraction_info: bool = False):
         """
         Initialize the audio extractor.
         
         Args:
             temp_dir (str): Directory for temporary files
+            reuse_extraction_info (bool): Take audio info for extracted files from
+                ffmpeg's own output instead of running ffprobe again
         """
         self.temp_dir = Path(temp_dir)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.reuse_extraction_info = reuse_extraction_info
+        self._extracted_audio_info: Dict[str, Dict] = {}
         
         # Check if ffmpeg is available
         if not self._check_ffmpeg():
@@ -36,18 +64,23 @@ class AudioExtractor:
     def _check_ffmpeg(self) -> bool:
         """
         Check if ffmpeg is available in the system PATH.
+
+        The probe runs once per process; later instances reuse the result.
         
         Returns:
             bool: True if ffmpeg is available
         """
-        try:
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, 
-                                  text=True, 
-                                  timeout=10)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        global _FFMPEG_AVAILABLE
+        if _FFMPEG_AVAILABLE is None:
+            try:
+                result = subprocess.run(['ffmpeg', '-version'], 
+                                      capture_output=True, 
+                                      text=True, 
+                                      timeout=10)
+                _FFMPEG_AVAILABLE = result.returncode == 0
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                _FFMPEG_AVAILABLE = False
+        return _FFMPEG_AVAILABLE
     
     def _clean_file_path(self, file_path: str) -> str:
         """
@@ -62,16 +95,12 @@ class AudioExtractor:
         if not file_path:
             return ""
         
-        # Remove file:// prefix if present
-        if file_path.startswith('file://'):
-            file_path = file_path[7:]
-        
-        # Handle localhost prefix
-        if file_path.startswith('localhost/'):
-            file_path = file_path[9:]
+        # Remove file:// and localhost prefixes if present
+        file_path = _FILE_URL_PREFIX_PATTERN.sub('', file_path, count=1)
         
-        # URL decode the path
-        file_path = unquote(file_path)
+        # URL decode the path (only needed when it contains escapes)
+        if '%' in file_path:
+            file_path = unquote(file_path)
         
         # Ensure it's an absolute path
         if not os.path.isabs(file_path):
@@ -79,6 +108,99 @@ class AudioExtractor:
         
         return file_path
     
+    def _build_ffmpeg_command(self, source_path: str, output: str) -> List[str]:
+        """
+        Build the ffmpeg command that converts the source to transcription-ready audio.
+        
+        Args:
+            source_path (str): Source media file
+            output (str): Output file path, or 'pipe:1' to write to stdout
+            
+        Returns:
+            List[str]: ffmpeg command line
+        """
+        # Convert to Opus at 16kbps for size reduction
+        # Opus is tuned for speech at low bitrates, so transcription quality holds
+        # while the upload is ~3-4x smaller than 56kbps MP3
+        return [
+            'ffmpeg',
+            '-i', source_path,
+            '-c:a', 'libopus',  # Opus speech codec
+            '-b:a', '16k',  # 16 kbps bitrate
+            '-application', 'voip',  # Optimize encoder for speech
+            '-ac', '1',  # Mono channel
+            '-ar', '16000',  # 16kHz sample rate (optimal for Whisper)
+            '-threads', '2',  # Bounded per job so parallel extractions don't oversubscribe
+            '-f', 'ogg',  # Ogg container (accepted by the transcription API)
+            '-y',  # Overwrite output file
+            output
+        ]
+    
+    def _run_ffmpeg(self, cmd: List[str], timeout: int) -> Tuple[int, str]:
+        """
+        Run ffmpeg, streaming its stderr to the debug log instead of buffering it.
+        
+        Only the stream information lines and the last few lines of output are
+        retained, so memory stays bounded however long the encode runs.
+        
+        Args:
+            cmd (List[str]): ffmpeg command line
+            timeout (int): Seconds before the process is killed
+            
+        Returns:
+            Tuple[int, str]: (return code, retained stderr text)
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='replace'
+        )
+        
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        
+        stream_info = []
+        tail = deque(maxlen=_STDERR_TAIL_LINES)
+        try:
+            for line in proc.stderr:
+                line = line.rstrip()
+                if not line:
+                    continue
+                logger.debug(line)
+                if 'Duration:' in line or 'Audio:' in line:
+                    stream_info.append(line)
+                else:
+                    tail.append(line)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stderr.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        
+        return returncode, "\n".join(stream_info + list(tail))
+    
+    def get_source_path(self, mono_track_info: Dict) -> str:
+        """
+        Resolve the local path of the media file behind an audio track.
+        
+        Args:
+            mono_track_info (Dict): Information about the mono audio track
+            
+        Returns:
+            str: Absolute path to the source media file
+        """
+        return self._clean_file_path(mono_track_info['media_path'])
+    
     def extract_audio_from_multicam(self, fcpxml_data: Dict, mono_track_info: Dict, 
                                    output_filename: Optional[str] = None) -> str:
         """
@@ -100,10 +222,10 @@ class AudioExtractor:
         if not os.path.exists(source_path):
             raise FileNotFoundError(f"Source audio file not found: {source_path}")
         
-        # Generate output filename - use MP3 for size reduction
+        # Generate output filename - use Opus in Ogg for size reduction
         if not output_filename:
             source_name = Path(source_path).stem
-            output_filename = f"{source_name}_extracted.mp3"
+            output_filename = f"{source_name}_extracted.ogg"
 
         output_path = self.temp_dir / output_filename
 
@@ -117,31 +239,16 @@ class AudioExtractor:
         logger.info(f"Output path: {output_path}")
 
         try:
-            # Build ffmpeg command - convert to MP3 at 56kbps for size reduction
-            # This maintains adequate quality for transcription while significantly reducing file size
-            cmd = [
-                'ffmpeg',
-                '-i', source_path,
-                '-b:a', '56k',  # 56 kbps bitrate (reduces ~10x from WAV)
-                '-ac', '1',  # Mono channel
-                '-ar', '16000',  # 16kHz sample rate (optimal for Whisper)
-                '-y',  # Overwrite output file
-                str(output_path)
-            ]
+            cmd = self._build_ffmpeg_command(source_path, str(output_path))
             
             logger.debug(f"Running ffmpeg command: {' '.join(cmd)}")
             
             # Run ffmpeg
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            returncode, stderr = self._run_ffmpeg(cmd, timeout=300)  # 5 minute timeout
             
-            if result.returncode != 0:
-                logger.error(f"ffmpeg error: {result.stderr}")
-                raise RuntimeError(f"Failed to extract audio: {result.stderr}")
+            if returncode != 0:
+                logger.error(f"ffmpeg error: {stderr}")
+                raise RuntimeError(f"Failed to extract audio: {stderr}")
             
             # Verify output file was created
             if not output_path.exists():
@@ -160,6 +267,11 @@ class AudioExtractor:
             if file_size_mb > 25:
                 logger.warning(f"Compressed file still {file_size_mb:.1f} MB - may need further compression")
 
+            if self.reuse_extraction_info:
+                audio_info = self._parse_ffmpeg_stderr(stderr, file_size)
+                if audio_info:
+                    self._extracted_audio_info[str(output_path)] = audio_info
+
             return str(output_path)
             
         except subprocess.TimeoutExpired:
@@ -169,6 +281,79 @@ class AudioExtractor:
             logger.error(f"Unexpected error during audio extraction: {e}")
             raise
     
+    def extract_many(self, fcpxml_data: Dict, tracks: List[Dict]) -> List[str]:
+        """
+        Extract several audio tracks concurrently.
+        
+        Each extraction runs in its own ffmpeg process, so a thread pool is enough
+        to overlap them; the pool is sized so that jobs at two threads each fit
+        the available cores. Output names carry the track's index, so sources
+        sharing a file name (e.g. A/cam1.mov and B/cam1.mov) never write to the
+        same file.
+        
+        Args:
+            fcpxml_data (Dict): Parsed FCPXML data
+            tracks (List[Dict]): Track information dicts, as for extract_audio_from_multicam
+            
+        Returns:
+            List[str]: Paths to the extracted audio files, in the order of `tracks`
+        """
+        if not tracks:
+            return []
+        
+        output_filenames = [
+            f"job{index:03d}_{Path(self._clean_file_path(track['media_path'])).stem}_extracted.ogg"
+            for index, track in enumerate(tracks)
+        ]
+        
+        max_workers = min(len(tracks), max(1, (os.cpu_count() or 2) // 2))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda track, output_filename: self.extract_audio_from_multicam(
+                    fcpxml_data, track, output_filename
+                ),
+                tracks, output_filenames
+            ))
+    
+    def extract_audio_to_bytes(self, fcpxml_data: Dict, mono_track_info: Dict) -> bytes:
+        """
+        Extract the mono audio track into memory without writing a temp file.
+        
+        ffmpeg streams the encoded Ogg/Opus output to stdout, so callers that only
+        need the bytes (e.g. for an upload) skip the disk write and read-back.
+        
+        Args:
+            fcpxml_data (Dict): Parsed FCPXML data
+            mono_track_info (Dict): Information about the mono audio track
+            
+        Returns:
+            bytes: Encoded audio data
+        """
+        source_path = self._clean_file_path(mono_track_info['media_path'])
+        
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Source audio file not found: {source_path}")
+        
+        cmd = self._build_ffmpeg_command(source_path, 'pipe:1')
+        # stdout carries the audio and stderr is captured whole here, so keep
+        # ffmpeg quiet apart from errors rather than buffer its progress output
+        cmd[1:1] = ['-nostats', '-loglevel', 'error']
+        logger.debug(f"Running ffmpeg command: {' '.join(cmd)}")
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=300)
+        except subprocess.TimeoutExpired:
+            logger.error("Audio extraction timed out")
+            raise RuntimeError("Audio extraction timed out after 5 minutes")
+        
+        if result.returncode != 0:
+            stderr = result.stderr.decode('utf-8', errors='replace')
+            logger.error(f"ffmpeg error: {stderr}")
+            raise RuntimeError(f"Failed to extract audio: {stderr}")
+        
+        logger.info(f"✅ Audio extracted to memory: {len(result.stdout) / (1024 * 1024):.1f} MB")
+        return result.stdout
+    
     def validate_audio_for_whisper(self, audio_path: str) -> Tuple[bool, str]:
         """
         Validate that an audio file is suitable for Whisper transcription.
@@ -219,16 +404,59 @@ class AudioExtractor:
         
         return True, "Audio file is valid for transcription"
     
+    def _parse_ffmpeg_stderr(self, stderr: str, file_size: int) -> Dict:
+        """
+        Build audio information from the stream details ffmpeg logs during extraction.
+        
+        Args:
+            stderr (str): ffmpeg stderr output
+            file_size (int): Size of the extracted file in bytes
+            
+        Returns:
+            Dict: Audio information in the get_audio_info format, or empty if not found
+        """
+        duration_match = _FFMPEG_DURATION_PATTERN.search(stderr)
+        # The output stream is listed after the input streams
+        stream_matches = _FFMPEG_AUDIO_STREAM_PATTERN.findall(stderr)
+        if not duration_match or not stream_matches:
+            return {}
+        
+        hours, minutes, seconds = duration_match.groups()
+        duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+        codec, sample_rate, layout = stream_matches[-1]
+        if layout == 'mono':
+            channels = 1
+        elif layout == 'stereo':
+            channels = 2
+        else:
+            channels = int(layout.split()[0])
+        
+        return {
+            'duration': duration,
+            'size': file_size,
+            'bitrate': int(file_size * 8 / duration) if duration > 0 else 0,
+            'sample_rate': int(sample_rate),
+            'channels': channels,
+            'codec': codec
+        }
+    
     def get_audio_info(self, audio_path: str) -> Dict:
         """
         Get information about an audio file using ffprobe.
         
+        Files produced by this extractor with reuse_extraction_info enabled are
+        answered from the information ffmpeg reported, without running ffprobe.
+        
         Args:
             audio_path (str): Path to the audio file
             
         Returns:
             Dict: Audio file information
         """
+        extracted_info = self._extracted_audio_info.get(str(audio_path))
+        if extracted_info:
+            return dict(extracted_info)
+        
         try:
             cmd = [
                 'ffprobe',
@@ -245,8 +473,7 @@ class AudioExtractor:
                 logger.warning(f"Could not get audio info: {result.stderr}")
                 return {}
             
-            import json
-            probe_data = json.loads(result.stdout)
+            probe_data = _json.loads(result.stdout)
             
             # Extract relevant information
             audio_info = {
@@ -267,7 +494,7 @@ class AudioExtractor:
             
             return audio_info
             
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, Exception) as e:
+        except (subprocess.TimeoutExpired, ValueError, Exception) as e:
             logger.warning(f"Could not get audio info: {e}")
             return {}
     
@@ -278,20 +505,19 @@ class AudioExtractor:
         Args:
             keep_files (list, optional): List of files to keep
         """
-        if keep_files is None:
-            keep_files = []
-        
-        keep_files = [Path(f).name for f in keep_files]
+        keep_names = {Path(f).name for f in keep_files or ()}
         
-        # Clean up both WAV and MP3 files
-        for pattern in ["*.wav", "*.mp3"]:
-            for file_path in self.temp_dir.glob(pattern):
-                if file_path.name not in keep_files:
+        # Clean up WAV, MP3 and Ogg files in a single directory scan
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
+                if (entry.name.endswith(('.wav', '.mp3', '.ogg'))
+                        and entry.name not in keep_names
+                        and entry.is_file()):
                     try:
-                        file_path.unlink()
-                        logger.debug(f"Deleted temporary file: {file_path}")
+                        os.unlink(entry.path)
+                        logger.debug(f"Deleted temporary file: {entry.path}")
                     except Exception as e:
-                        logger.warning(f"Could not delete temporary file {file_path}: {e}")
+                        logger.warning(f"Could not delete temporary file {entry.path}: {e}")
 
 if __name__ == "__main__":
     import logging
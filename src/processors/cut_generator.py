@@ -3,16 +3,36 @@ Cut Generator Module
 Generates FCPXML files with blade cuts applied based on cleaned transcript timing mappings.
 """
 
-import xml.etree.ElementTree as ET
+import copy
+from bisect import bisect_left
+from fractions import Fraction
+from functools import partial
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 import logging
 from datetime import datetime, timezone
 from ..utils import FrameRateHandler, FrameRateInfo
 
+try:
+    from lxml import etree as ET  # libxml2 parses and serializes large FCPXML much faster
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
+# Faster cut metadata serialization when orjson is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Output file buffer size in bytes
+_WRITE_BUFFER_SIZE = 1 << 20
+
 class CutGenerator:
     """
     Generates FCPXML files with blade cuts applied to remove unwanted sections.
@@ -22,11 +42,14 @@ class CutGenerator:
         """Initialize the cut generator."""
         self.original_fcpxml = None
         self.original_tree = None
+        self._parent_map = None  # child -> parent, built on first lookup without lxml
         self.cut_ranges = []
         self.keep_ranges = []
+        self.keep_offsets = [0.0]  # Timeline offset of each keep range, then the total
         self.frame_rate_handler = FrameRateHandler()
         self.project_frame_rates = {}
         self.primary_frame_rate = None
+        self._run_time = None  # Local time of the current generation, set once per run
     
     def generate_cut_fcpxml(self, original_fcpxml_path: str,
                            cleaned_transcript_data: Dict,
@@ -46,6 +69,9 @@ class CutGenerator:
         """
         logger.info("Generating cut FCPXML...")
 
+        # One timestamp per run, so every uid, name and modDate written agrees
+        self._run_time = datetime.now(timezone.utc).astimezone()
+
         # Load original FCPXML
         self._load_original_fcpxml(original_fcpxml_path)
 
@@ -62,6 +88,17 @@ class CutGenerator:
             self.keep_ranges = self._filter_ranges_by_edited_segments(
                 self.keep_ranges, edited_segments
             )
+
+        # Gaps shorter than a frame vanish once times snap to frames, so they
+        # would only split the clip without removing anything
+        frame_duration = 1.0 / self.primary_frame_rate.rate if self.primary_frame_rate else 0.0
+        self.keep_ranges = self._merge_close_ranges(self.keep_ranges, frame_duration)
+
+        # Where each kept range lands on the cut timeline; the last entry is
+        # the cut timeline's total duration
+        self.keep_offsets = list(accumulate(
+            (kr['end'] - kr['start'] for kr in self.keep_ranges), initial=0.0
+        ))
         
         logger.info(f"Applying {len(self.cut_ranges)} cuts to multicam clip")
         logger.info(f"Keeping {len(self.keep_ranges)} ranges")
@@ -81,8 +118,16 @@ class CutGenerator:
     
     def _load_original_fcpxml(self, fcpxml_path: str):
         """Load and parse the original FCPXML file."""
-        self.original_tree = ET.parse(fcpxml_path)
+        if _HAS_LXML:
+            # Drop what the stdlib parser drops too (comments, processing
+            # instructions), plus layout whitespace so pretty_print can
+            # indent the output on its own
+            parser = ET.XMLParser(remove_blank_text=True, remove_comments=True, remove_pis=True)
+            self.original_tree = ET.parse(fcpxml_path, parser)
+        else:
+            self.original_tree = ET.parse(fcpxml_path)
         self.original_fcpxml = self.original_tree.getroot()
+        self._parent_map = None
         logger.debug(f"Loaded original FCPXML: {fcpxml_path}")
     
     def _extract_frame_rate_info(self, cleaned_transcript_data: Dict):
@@ -94,27 +139,12 @@ class CutGenerator:
         if 'frame_rates' in fcpxml_data:
             # Convert dict back to FrameRateInfo objects
             for resource_id, rate_dict in fcpxml_data['frame_rates'].items():
-                rate_info = FrameRateInfo(
-                    rate=rate_dict['rate'],
-                    timebase=rate_dict['timebase'],
-                    timescale=rate_dict['timescale'],
-                    is_drop_frame=rate_dict['is_drop_frame'],
-                    name=rate_dict['name'],
-                    fcpxml_duration_format=rate_dict['fcpxml_duration_format']
-                )
-                self.project_frame_rates[resource_id] = rate_info
+                self.project_frame_rates[resource_id] = FrameRateInfo.from_dict(rate_dict)
         
         # Set primary frame rate
         primary_rate_dict = fcpxml_data.get('primary_frame_rate')
         if primary_rate_dict:
-            self.primary_frame_rate = FrameRateInfo(
-                rate=primary_rate_dict['rate'],
-                timebase=primary_rate_dict['timebase'],
-                timescale=primary_rate_dict['timescale'],
-                is_drop_frame=primary_rate_dict['is_drop_frame'],
-                name=primary_rate_dict['name'],
-                fcpxml_duration_format=primary_rate_dict['fcpxml_duration_format']
-            )
+            self.primary_frame_rate = FrameRateInfo.from_dict(primary_rate_dict)
         else:
             # Fallback to detecting from XML directly
             self._detect_frame_rates_from_xml()
@@ -139,9 +169,10 @@ class CutGenerator:
     
     def _apply_cuts_to_fcpxml(self) -> ET.ElementTree:
         """Apply the blade cuts to the FCPXML structure by creating a new project."""
-        # Create a copy of the original tree
-        new_root = self._deep_copy_element(self.original_fcpxml)
-        new_tree = ET.ElementTree(new_root)
+        # The loaded tree is read only to build this output, so it is edited
+        # in place rather than holding a second full copy of the document
+        new_root = self.original_fcpxml
+        new_tree = self.original_tree
 
         # Find the original sequence to use as a template
         original_sequence = new_root.find('.//sequence')
@@ -156,10 +187,10 @@ class CutGenerator:
             library = new_root.find('library')
             if library is not None:
                 # Create an event if none exists
-                event = ET.Element('event')
-                event.set('name', 'Auto-Cut Events')
-                event.set('uid', f'auto-cut-event-{datetime.now().strftime("%Y%m%d%H%M%S")}')
-                library.append(event)
+                event = ET.SubElement(library, 'event', {
+                    'name': 'Auto-Cut Events',
+                    'uid': f'auto-cut-event-{self._run_time.strftime("%Y%m%d%H%M%S")}',
+                })
             else:
                 logger.error("No event or library found in FCPXML")
                 return new_tree
@@ -167,14 +198,15 @@ class CutGenerator:
         # Find the original project for reference
         original_project = new_root.find('.//project')
 
-        # Create a NEW project for the cut version
-        cut_project = ET.Element('project')
-        original_project_name = original_project.get('name', 'Project') if original_project else 'Project'
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        cut_project.set('name', f"{original_project_name}_AutoCut_{timestamp}")
-        cut_project.set('uid', f'auto-cut-{timestamp}')
-        # Ensure modDate has proper timezone format (e.g., "2025-09-15 06:18:30 -0400")
-        cut_project.set('modDate', datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S %z'))
+        # Attributes of the NEW project for the cut version
+        original_project_name = original_project.get('name', 'Project') if original_project is not None else 'Project'
+        timestamp = self._run_time.strftime('%Y%m%d_%H%M%S')
+        cut_project_attrib = {
+            'name': f"{original_project_name}_AutoCut_{timestamp}",
+            'uid': f'auto-cut-{timestamp}',
+            # Ensure modDate has proper timezone format (e.g., "2025-09-15 06:18:30 -0400")
+            'modDate': self._run_time.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S %z'),
+        }
 
         # Create a new sequence for the cut version
         cut_sequence = self._create_cut_sequence(original_sequence)
@@ -182,15 +214,13 @@ class CutGenerator:
         # Process multicam clips in the cut sequence
         mc_clips = cut_sequence.findall('.//mc-clip')
         for mc_clip in mc_clips:
-            logger.debug(f"Processing multicam clip: {mc_clip.get('name', 'unnamed')}")
+            logger.debug("Processing multicam clip: %s", mc_clip.get('name', 'unnamed'))
             self._apply_cuts_to_multicam_clip_new(mc_clip, cut_sequence)
 
-        # Add the cut sequence to the NEW project
+        # Add the NEW project to the event, holding the cut sequence
+        cut_project = ET.SubElement(event, 'project', cut_project_attrib)
         cut_project.append(cut_sequence)
 
-        # Add the new project to the event
-        event.append(cut_project)
-
         logger.info(f"Created new project: {cut_project.get('name')}")
 
         return new_tree
@@ -205,7 +235,7 @@ class CutGenerator:
             del cut_sequence.attrib['name']
 
         # Update the duration based on actual cuts
-        total_duration = sum(kr['end'] - kr['start'] for kr in self.keep_ranges)
+        total_duration = self.keep_offsets[-1]
         format_ref = cut_sequence.get('format')
         cut_sequence.set('duration', self._seconds_to_rational_time(total_duration, format_ref))
 
@@ -227,7 +257,7 @@ class CutGenerator:
         start_seconds = self._rational_time_to_seconds(original_start, format_ref)
         duration_seconds = self._rational_time_to_seconds(original_duration, format_ref)
 
-        logger.debug(f"Original clip: offset={offset_seconds}s, start={start_seconds}s, duration={duration_seconds}s")
+        logger.debug("Original clip: offset=%ss, start=%ss, duration=%ss", offset_seconds, start_seconds, duration_seconds)
 
         # Find the spine element in the sequence
         spine = parent_sequence.find('.//spine')
@@ -238,22 +268,20 @@ class CutGenerator:
         # Clear the spine and add cut segments
         spine.clear()
 
-        # Track cumulative offset for positioning segments
-        cumulative_offset = 0.0
+        # Every segment shares the clip's format, so resolve its rate once
+        to_rational = self._make_rational_converter(format_ref)
 
-        # Create new multicam clips for each keep range
-        for i, keep_range in enumerate(self.keep_ranges):
+        # Create new multicam clips for each keep range, positioned one after another
+        for i, (keep_range, timeline_offset) in enumerate(zip(self.keep_ranges, self.keep_offsets)):
             new_clip = self._create_sequential_cut_clip(
-                mc_clip_element, keep_range, cumulative_offset, i, format_ref
+                mc_clip_element, keep_range, timeline_offset, i, to_rational
             )
             if new_clip is not None:
                 spine.append(new_clip)
-                # Update cumulative offset for next segment
-                cumulative_offset += (keep_range['end'] - keep_range['start'])
 
     def _create_sequential_cut_clip(self, original_clip, keep_range: Dict,
                                    timeline_offset: float, segment_index: int,
-                                   format_ref: Optional[str] = None):
+                                   to_rational: Callable[[float], str]):
         """Create a multicam clip segment positioned sequentially in the new timeline."""
         # Create a copy of the original clip
         new_clip = self._deep_copy_element(original_clip)
@@ -265,11 +293,11 @@ class CutGenerator:
 
         # Convert times to rational format
         # The offset in the new timeline is the cumulative position
-        new_offset_rational = self._seconds_to_rational_time(timeline_offset, format_ref)
+        new_offset_rational = to_rational(timeline_offset)
         # The start time references the source position in the original clip
-        new_start_rational = self._seconds_to_rational_time(range_start, format_ref)
+        new_start_rational = to_rational(range_start)
         # Duration is the length of this segment
-        new_duration_rational = self._seconds_to_rational_time(range_duration, format_ref)
+        new_duration_rational = to_rational(range_duration)
 
         # Update clip attributes
         new_clip.set('offset', new_offset_rational)
@@ -280,10 +308,11 @@ class CutGenerator:
         original_name = new_clip.get('name', 'Multicam Clip')
         new_clip.set('name', f"{original_name} - Cut {segment_index + 1}")
 
-        logger.debug(f"Created sequential cut {segment_index + 1}:")
-        logger.debug(f"  Timeline offset={new_offset_rational} ({timeline_offset:.3f}s)")
-        logger.debug(f"  Source start={new_start_rational} ({range_start:.3f}s)")
-        logger.debug(f"  Duration={new_duration_rational} ({range_duration:.3f}s)")
+        # Per-segment messages are formatted only when debug logging is on
+        logger.debug("Created sequential cut %d:", segment_index + 1)
+        logger.debug("  Timeline offset=%s (%.3fs)", new_offset_rational, timeline_offset)
+        logger.debug("  Source start=%s (%.3fs)", new_start_rational, range_start)
+        logger.debug("  Duration=%s (%.3fs)", new_duration_rational, range_duration)
 
         return new_clip
 
@@ -300,8 +329,8 @@ class CutGenerator:
         start_seconds = self._rational_time_to_seconds(original_start, format_ref)
         duration_seconds = self._rational_time_to_seconds(original_duration, format_ref)
         
-        logger.debug(f"Original clip: offset={offset_seconds}s, start={start_seconds}s, duration={duration_seconds}s")
-        logger.debug(f"Format reference: {format_ref}")
+        logger.debug("Original clip: offset=%ss, start=%ss, duration=%ss", offset_seconds, start_seconds, duration_seconds)
+        logger.debug("Format reference: %s", format_ref)
         
         # Find the parent element to replace the multicam clip
         parent = self._find_parent_element(mc_clip_element)
@@ -347,32 +376,27 @@ class CutGenerator:
         original_name = new_clip.get('name', 'Multicam Clip')
         new_clip.set('name', f"{original_name} - Segment {segment_index + 1}")
         
-        logger.debug(f"Created cut segment {segment_index + 1}:")
-        logger.debug(f"  offset={new_offset_rational} ({new_offset:.3f}s)")
-        logger.debug(f"  start={new_start_rational} ({range_start:.3f}s)")
-        logger.debug(f"  duration={new_duration_rational} ({range_duration:.3f}s)")
+        logger.debug("Created cut segment %d:", segment_index + 1)
+        logger.debug("  offset=%s (%.3fs)", new_offset_rational, new_offset)
+        logger.debug("  start=%s (%.3fs)", new_start_rational, range_start)
+        logger.debug("  duration=%s (%.3fs)", new_duration_rational, range_duration)
         
         return new_clip
     
     def _find_parent_element(self, element) -> Optional[ET.Element]:
-        """Find the parent element of a given element."""
-        for parent in self.original_tree.iter():
-            for child in parent:
-                if child == element:
-                    return parent
-        return None
+        """Find the parent element of a given element in the original tree."""
+        if _HAS_LXML:
+            return element.getparent()
+        # Stdlib elements don't know their parent; map every child to its
+        # parent in one pass rather than rescanning the tree per lookup
+        if self._parent_map is None:
+            self._parent_map = {child: parent for parent in self.original_tree.iter() for child in parent}
+        return self._parent_map.get(element)
     
     def _deep_copy_element(self, element) -> ET.Element:
         """Create a deep copy of an XML element."""
-        new_element = ET.Element(element.tag, element.attrib.copy())
-        new_element.text = element.text
-        new_element.tail = element.tail
-        
-        for child in element:
-            new_child = self._deep_copy_element(child)
-            new_element.append(new_child)
-        
-        return new_element
+        # Both lxml and the stdlib C accelerator copy the whole subtree natively
+        return copy.deepcopy(element)
     
     def _rational_time_to_seconds(self, rational_time: str, context_format_id: Optional[str] = None) -> float:
         """Convert FCPXML rational time format to seconds using frame rate context."""
@@ -413,33 +437,66 @@ class CutGenerator:
         Returns:
             Filtered list of keep ranges
         """
-        filtered_ranges = []
+        # A range is kept if some kept segment starts before the range ends and
+        # ends after it starts. With kept segments sorted by start, the ones
+        # starting before a range's end form a prefix, and the running maximum
+        # of their ends tells whether any of them reaches past the range start
+        kept = sorted(
+            (segment.get('start', 0), segment.get('end', 0))
+            for segment in edited_segments if segment.get('keep', False)
+        )
+        starts = [seg_start for seg_start, _ in kept]
+        max_ends = list(accumulate((seg_end for _, seg_end in kept), max))
 
+        filtered_ranges = []
         for keep_range in keep_ranges:
-            # Check if any segment in this range should be kept
-            range_start = keep_range['start']
-            range_end = keep_range['end']
-
-            # Find segments that overlap with this range
-            should_keep = False
-            for segment in edited_segments:
-                seg_start = segment.get('start', 0)
-                seg_end = segment.get('end', 0)
-
-                # Check if segment overlaps with this range and is marked to keep
-                if (seg_start < range_end and seg_end > range_start and
-                    segment.get('keep', False)):
-                    should_keep = True
-                    break
-
-            if should_keep:
+            count = bisect_left(starts, keep_range['end'])
+            if count and max_ends[count - 1] > keep_range['start']:
                 filtered_ranges.append(keep_range)
 
         logger.info(f"Filtered {len(keep_ranges)} ranges to {len(filtered_ranges)} based on edited transcript")
         return filtered_ranges
 
+    def _merge_close_ranges(self, ranges: List[Dict], delta_t: float) -> List[Dict]:
+        """
+        Merge ranges separated by gaps shorter than delta_t.
+
+        Args:
+            ranges: Keep ranges with 'start' and 'end' in seconds
+            delta_t: Largest gap in seconds that is closed rather than cut
+
+        Returns:
+            New list of ranges sorted by start; the input dicts are not modified
+        """
+        merged = []
+        for keep_range in sorted(ranges, key=lambda r: r['start']):
+            if merged and keep_range['start'] - merged[-1]['end'] < delta_t:
+                if keep_range['end'] > merged[-1]['end']:
+                    merged[-1]['end'] = keep_range['end']
+            else:
+                merged.append(dict(keep_range))
+
+        if len(merged) < len(ranges):
+            logger.info(f"Merged {len(ranges)} ranges into {len(merged)} across sub-frame gaps")
+        return merged
+
     def _seconds_to_rational_time(self, seconds: float, context_format_id: Optional[str] = None) -> str:
         """Convert seconds to FCPXML rational time format using frame rate context."""
+        return self._make_rational_converter(context_format_id)(seconds)
+
+    def _make_rational_converter(self, context_format_id: Optional[str] = None) -> Callable[[float], str]:
+        """
+        Build a seconds to rational time converter for one format.
+
+        The frame rate is looked up and its branch chosen once, so converting
+        many times in the same format costs only the arithmetic.
+
+        Args:
+            context_format_id: Format resource ID; the primary rate is used if unknown
+
+        Returns:
+            Callable[[float], str]: Converter from seconds to rational time
+        """
         # Get frame rate context
         frame_rate_info = None
         if context_format_id and context_format_id in self.project_frame_rates:
@@ -447,24 +504,34 @@ class CutGenerator:
         elif self.primary_frame_rate:
             frame_rate_info = self.primary_frame_rate
 
-        if frame_rate_info:
-            # For 29.97 DF, ensure frame alignment
-            if frame_rate_info.is_drop_frame and abs(frame_rate_info.rate - 29.97) < 0.01:
-                # Convert to frames first, then round to nearest frame
-                total_frames = round(seconds * 29.97)
-                # Convert frames to rational time (each frame is 1001/30000s)
-                numerator = total_frames * 1001
-                denominator = 30000
-                return f"{numerator}/{denominator}s"
-            else:
-                return self.frame_rate_handler.seconds_to_rational_time(seconds, frame_rate_info)
-        else:
-            return f"{seconds}s"
-    
+        if not frame_rate_info or frame_rate_info.timebase == 1:
+            return lambda seconds: f"{seconds}s"
+
+        # Drop frame rates undo the handler's correction, so times decoded
+        # through it are written back unchanged
+        if frame_rate_info.is_drop_frame:
+            return partial(self.frame_rate_handler.seconds_to_rational_time,
+                           frame_rate_info=frame_rate_info)
+
+        # Non-drop rates snap to whole frames exactly, as FrameRateHandler does
+        rate_fraction = frame_rate_info.rate_fraction
+        suffix = f"/{frame_rate_info.timebase}s"
+        timescale = frame_rate_info.timescale
+        return lambda seconds: f"{round(Fraction(seconds) * rate_fraction) * timescale}{suffix}"
+
     def _fix_dtd_validation_issues(self, root):
         """Fix common DTD validation issues in the FCPXML structure."""
+        # Bin the elements checked below in one walk of the tree rather than
+        # one descendant search per tag; binned before any are modified
+        assets, sequences, projects, events = [], [], [], []
+        bins = {'asset': assets, 'sequence': sequences, 'project': projects, 'event': events}
+        for elem in root.iter():
+            found = bins.get(elem.tag)
+            if found is not None:
+                found.append(elem)
+
         # Find all asset elements
-        for asset in root.findall('.//asset'):
+        for asset in assets:
             # Check if asset has a media-rep element
             media_rep = asset.find('media-rep')
             if media_rep is None:
@@ -473,10 +540,11 @@ class CutGenerator:
                 logger.warning(f"Asset {asset.get('id', 'unknown')} missing media-rep, adding placeholder")
 
                 # Create a minimal media-rep element
-                media_rep = ET.Element('media-rep')
-                media_rep.set('kind', 'original-media')
-                media_rep.set('sig', asset.get('uid', 'placeholder'))
-                media_rep.set('src', 'file:///placeholder')
+                media_rep = ET.Element('media-rep', {
+                    'kind': 'original-media',
+                    'sig': asset.get('uid', 'placeholder'),
+                    'src': 'file:///placeholder',
+                })
 
                 # Insert media-rep as the first child (before metadata if it exists)
                 metadata = asset.find('metadata')
@@ -488,30 +556,28 @@ class CutGenerator:
                     asset.append(media_rep)
 
         # Remove invalid 'name' attributes from sequences (not allowed by DTD)
-        for sequence in root.findall('.//sequence'):
+        for sequence in sequences:
             if 'name' in sequence.attrib:
                 logger.debug(f"Removing invalid 'name' attribute from sequence")
                 del sequence.attrib['name']
 
         # Fix any project structure issues
-        project = root.find('.//project')
-        if project is None:
+        if not projects:
             # If no project exists, try to find library/event and create project there
-            event = root.find('.//event')
-            if event is not None:
+            if events:
+                event = events[0]
                 logger.info("No project found, creating one in event")
-                project = ET.Element('project')
-                project.set('name', 'Auto-Cut Project')
-                project.set('uid', 'auto-generated')
-                project.set('modDate', datetime.now().strftime('%Y-%m-%d %H:%M:%S %z'))
+                project = ET.SubElement(event, 'project', {
+                    'name': 'Auto-Cut Project',
+                    'uid': 'auto-generated',
+                    'modDate': self._run_time.strftime('%Y-%m-%d %H:%M:%S %z'),
+                })
 
                 # Move any sequences from event to project
                 for sequence in event.findall('sequence'):
                     event.remove(sequence)
                     project.append(sequence)
 
-                event.append(project)
-
     def _save_fcpxml(self, tree: ET.ElementTree, output_path: str):
         """Save the modified FCPXML tree to file."""
         output_path = Path(output_path)
@@ -520,18 +586,25 @@ class CutGenerator:
         # Fix any DTD validation issues before saving
         self._fix_dtd_validation_issues(tree.getroot())
 
-        # Format the XML nicely
-        self._indent_xml(tree.getroot())
-
-        # Write the file with proper XML declaration
-        with open(output_path, 'wb') as f:
+        # Write the file with proper XML declaration, formatted nicely. The
+        # serializers emit many small fragments; a large buffer batches them
+        # into few write calls without holding a second copy of the document
+        with open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
-            tree.write(f, encoding='UTF-8', xml_declaration=False)
+            if _HAS_LXML:
+                tree.write(f, encoding='UTF-8', xml_declaration=False, pretty_print=True)
+            else:
+                if hasattr(ET, 'indent'):  # Python 3.9+
+                    ET.indent(tree, space='  ')
+                    tree.getroot().tail = '\n'
+                else:
+                    self._indent_xml(tree.getroot())
+                tree.write(f, encoding='UTF-8', xml_declaration=False)
 
         logger.debug(f"Saved FCPXML to: {output_path}")
     
     def _indent_xml(self, element, level: int = 0):
-        """Add proper indentation to XML for readability."""
+        """Add proper indentation to XML for readability; fallback for Python 3.8."""
         indent = "  " * level
         if len(element):
             if not element.text or not element.text.strip():
@@ -543,7 +616,7 @@ class CutGenerator:
             if not child.tail or not child.tail.strip():
                 child.tail = f"\n{indent}"
         else:
-            if level and (not element.tail or not element.tail.strip):
+            if level and (not element.tail or not element.tail.strip()):
                 element.tail = f"\n{indent}"
     
     def _add_cut_metadata(self, fcpxml_path: str, cleaned_data: Dict):
@@ -553,7 +626,7 @@ class CutGenerator:
             
             metadata = {
                 'generated_by': 'Multicam Auto-Cut System',
-                'generation_time': datetime.now().isoformat(),
+                'generation_time': self._run_time.replace(tzinfo=None).isoformat(),
                 'original_duration': cleaned_data['timing_mapping']['total_original_duration'],
                 'cleaned_duration': cleaned_data['timing_mapping']['total_cleaned_duration'],
                 'time_saved': cleaned_data['timing_mapping']['total_original_duration'] - 
@@ -565,9 +638,13 @@ class CutGenerator:
                 'take_groups': len(cleaned_data['take_groups'])
             }
             
-            import json
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            # Indented either way, as the metadata sits next to the output for people to read
+            if orjson:
+                metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            else:
+                import json
+                with open(metadata_path, 'w', encoding='utf-8') as f:
+                    json.dump(metadata, f, indent=2)
             
             logger.info(f"Cut metadata saved to: {metadata_path}")
             
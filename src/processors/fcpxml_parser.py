@@ -17,39 +17,46 @@ class FCPXMLParser:
     Parser for Final Cut Pro X XML files with focus on multicam clips.
     """
     
+    # Elements whose handlers read their descendants
+    _SUBTREE_TAGS = frozenset(('asset', 'mc-clip'))
+    
     def __init__(self):
-        self.tree = None
         self.root = None
         self.resources = {}
         self.multicam_clips = []
         self.frame_rate_handler = FrameRateHandler()
         self.detected_frame_rates = {}
         self.primary_frame_rate = None
+        self._timeline_duration = None
         
-    def parse_fcpxml(self, file_path: str) -> Dict:
+    def parse_fcpxml(self, file_path: str, stop_after_timeline: bool = False) -> Dict:
         """
         Parse an FCPXML file and extract relevant information.
         
         Args:
             file_path (str): Path to the FCPXML file
+            stop_after_timeline (bool): Stop reading once the resources and the
+                first timeline sequence holding a multicam clip have been seen;
+                later projects and their clips are then left out of the result
             
         Returns:
             Dict: Parsed FCPXML data structure
         """
         try:
-            # Parse the XML file
-            self.tree = ET.parse(file_path)
-            self.root = self.tree.getroot()
+            # Stream the XML file in a single pass
+            parsed = self._stream_fcpxml(file_path, stop_after_timeline)
             
             # Extract basic information
             fcpxml_data = {
                 'version': self.root.get('version'),
                 'file_path': file_path,
-                'resources': self._parse_resources(),
-                'projects': self._parse_projects(),
-                'multicam_clips': self._find_multicam_clips(),
-                'frame_rates': self._detect_and_validate_frame_rates(),
-                'primary_frame_rate': self.primary_frame_rate.__dict__ if self.primary_frame_rate else None
+                'resources': parsed['resources'],
+                'projects': parsed['projects'],
+                'multicam_clips': parsed['multicam_clips'],
+                'frame_rates': self._detect_and_validate_frame_rates(
+                    parsed['formats'], parsed['sequences']
+                ),
+                'primary_frame_rate': self.primary_frame_rate.to_dict() if self.primary_frame_rate else None
             }
             
             logger.info(f"Successfully parsed FCPXML file: {file_path}")
@@ -68,59 +75,143 @@ class FCPXMLParser:
             logger.error(f"Unexpected error parsing FCPXML: {e}")
             raise
     
-    def _parse_resources(self) -> Dict:
+    def _stream_fcpxml(self, file_path: str, stop_after_timeline: bool = False) -> Dict:
         """
-        Parse the resources section to get asset and format information.
-        
+        Read an FCPXML file in one streaming pass.
+
+        Each element is handled when it ends and is then removed from its
+        parent, so memory stays proportional to the nesting depth rather than
+        the document. Assets and mc-clips keep their subtrees until they end,
+        since their handlers read media-rep and mc-angle children. `self.root`
+        is left holding the root element's attributes only.
+
+        Args:
+            file_path (str): Path to the FCPXML file
+            stop_after_timeline (bool): Stop at the end of the first sequence
+                after the resources once a multicam clip has been found
+
         Returns:
-            Dict: Resources information
+            Dict: 'resources', 'projects' and 'multicam_clips' in the shapes
+            parse_fcpxml reports, plus the 'formats' and 'sequences' elements
+            (attributes only) for frame rate detection
         """
-        resources = {}
-        
-        resources_element = self.root.find('resources')
-        if resources_element is None:
+        assets, formats, multicams = {}, {}, {}
+        format_elements, sequence_elements = [], []
+        projects, multicam_clips = [], []
+        has_resources = False
+
+        stack = []
+        subtree_depth = 0
+        with open(file_path, 'rb') as source:
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                tag = elem.tag
+                if event == 'start':
+                    if not stack:
+                        self.root = elem
+                    stack.append(elem)
+                    if tag in self._SUBTREE_TAGS:
+                        subtree_depth += 1
+                    continue
+
+                stack.pop()
+                depth = len(stack)
+                in_resources = depth == 2 and stack[1].tag == 'resources'
+
+                if tag == 'asset':
+                    if in_resources:
+                        assets[elem.get('id')] = self._parse_asset(elem)
+                elif tag == 'format':
+                    if in_resources:
+                        formats[elem.get('id')] = self._parse_format(elem)
+                        format_elements.append(elem)
+                elif tag == 'mc-clip':
+                    if in_resources:
+                        multicams[elem.get('id')] = {
+                            'type': 'multicam',
+                            'name': elem.get('name'),
+                            'angles': self._parse_multicam_angles(elem)
+                        }
+                    multicam_clips.append(self._parse_multicam_clip(elem))
+                elif tag == 'sequence':
+                    sequence_elements.append(elem)
+                    # Sequences inside resources (compound clips) end before the
+                    # resources do, so this only fires on a timeline sequence
+                    if stop_after_timeline and has_resources and multicam_clips:
+                        logger.debug("Stopping FCPXML parse after the first timeline sequence")
+                        break
+                elif tag == 'project':
+                    if depth == 1:
+                        projects.append({
+                            'name': elem.get('name'),
+                            'uid': elem.get('uid'),
+                            'modDate': elem.get('modDate')
+                        })
+                elif tag == 'resources' and depth == 1:
+                    has_resources = True
+
+                if tag in self._SUBTREE_TAGS:
+                    subtree_depth -= 1
+                if subtree_depth == 0 and stack:
+                    # iterparse may already have attached later siblings, so
+                    # detach this element by identity rather than by position
+                    stack[-1].remove(elem)
+
+        if not has_resources:
             logger.warning("No resources section found in FCPXML")
-            return resources
-        
-        # Parse assets (media files)
-        for asset in resources_element.findall('asset'):
-            asset_id = asset.get('id')
-            resources[asset_id] = {
-                'type': 'asset',
-                'name': asset.get('name'),
-                'uid': asset.get('uid'),
-                'start': asset.get('start'),
-                'duration': asset.get('duration'),
-                'hasVideo': asset.get('hasVideo') == '1',
-                'hasAudio': asset.get('hasAudio') == '1',
-                'audioSources': int(asset.get('audioSources', 0)),
-                'audioChannels': int(asset.get('audioChannels', 0)),
-                'audioRate': asset.get('audioRate'),
-                'media_path': self._extract_media_path(asset)
-            }
-        
-        # Parse formats
-        for format_elem in resources_element.findall('format'):
-            format_id = format_elem.get('id')
-            resources[format_id] = {
-                'type': 'format',
-                'name': format_elem.get('name'),
-                'frameDuration': format_elem.get('frameDuration'),
-                'width': format_elem.get('width'),
-                'height': format_elem.get('height'),
-                'colorSpace': format_elem.get('colorSpace')
-            }
-        
-        # Parse multicam clips in resources
-        for mc_clip in resources_element.findall('mc-clip'):
-            mc_id = mc_clip.get('id')
-            resources[mc_id] = {
-                'type': 'multicam',
-                'name': mc_clip.get('name'),
-                'angles': self._parse_multicam_angles(mc_clip)
-            }
-        
-        return resources
+
+        self._timeline_duration = sequence_elements[0].get('duration') if sequence_elements else None
+
+        return {
+            # Assets first, then formats, then multicam clips
+            'resources': {**assets, **formats, **multicams},
+            'projects': projects,
+            'multicam_clips': multicam_clips,
+            'formats': format_elements,
+            'sequences': sequence_elements
+        }
+
+    def _parse_asset(self, asset) -> Dict:
+        """
+        Describe an asset (media file) resource.
+
+        Args:
+            asset: XML element for the asset
+
+        Returns:
+            Dict: Asset information
+        """
+        return {
+            'type': 'asset',
+            'name': asset.get('name'),
+            'uid': asset.get('uid'),
+            'start': asset.get('start'),
+            'duration': asset.get('duration'),
+            'hasVideo': asset.get('hasVideo') == '1',
+            'hasAudio': asset.get('hasAudio') == '1',
+            'audioSources': int(asset.get('audioSources', 0)),
+            'audioChannels': int(asset.get('audioChannels', 0)),
+            'audioRate': asset.get('audioRate'),
+            'media_path': self._extract_media_path(asset)
+        }
+
+    def _parse_format(self, format_elem) -> Dict:
+        """
+        Describe a format resource.
+
+        Args:
+            format_elem: XML element for the format
+
+        Returns:
+            Dict: Format information
+        """
+        return {
+            'type': 'format',
+            'name': format_elem.get('name'),
+            'frameDuration': format_elem.get('frameDuration'),
+            'width': format_elem.get('width'),
+            'height': format_elem.get('height'),
+            'colorSpace': format_elem.get('colorSpace')
+        }
     
     def _extract_media_path(self, asset_element) -> Optional[str]:
         """
@@ -174,52 +265,35 @@ class FCPXMLParser:
         
         return angles
     
-    def _parse_projects(self) -> List[Dict]:
-        """
-        Parse project information from the FCPXML.
-        
-        Returns:
-            List[Dict]: List of projects
-        """
-        projects = []
-        
-        for project in self.root.findall('project'):
-            projects.append({
-                'name': project.get('name'),
-                'uid': project.get('uid'),
-                'modDate': project.get('modDate')
-            })
-        
-        return projects
-    
-    def _find_multicam_clips(self) -> List[Dict]:
+    def _parse_multicam_clip(self, mc_clip) -> Dict:
         """
-        Find all multicam clips referenced in the timeline.
-        
+        Describe a multicam clip, either a resource or a timeline reference.
+
+        Args:
+            mc_clip: XML element for the multicam clip
+
         Returns:
-            List[Dict]: List of multicam clip references
+            Dict: Multicam clip reference; angles are parsed only for clips
+            that don't reference a resource
         """
-        multicam_clips = []
-        
-        # Look for mc-clip elements in the timeline
-        for mc_clip in self.root.findall('.//mc-clip'):
-            clip_ref = mc_clip.get('ref')
-            clip_data = {
-                'ref': clip_ref,
-                'name': mc_clip.get('name'),
-                'offset': mc_clip.get('offset'),
-                'start': mc_clip.get('start'),
-                'duration': mc_clip.get('duration'),
-                'angles': self._parse_multicam_angles(mc_clip) if not clip_ref else None
-            }
-            multicam_clips.append(clip_data)
-        
-        return multicam_clips
+        clip_ref = mc_clip.get('ref')
+        return {
+            'ref': clip_ref,
+            'name': mc_clip.get('name'),
+            'offset': mc_clip.get('offset'),
+            'start': mc_clip.get('start'),
+            'duration': mc_clip.get('duration'),
+            'angles': self._parse_multicam_angles(mc_clip) if not clip_ref else None
+        }
     
-    def _detect_and_validate_frame_rates(self) -> Dict[str, Dict]:
+    def _detect_and_validate_frame_rates(self, format_elements: List, sequence_elements: List) -> Dict[str, Dict]:
         """
         Detect all frame rates in the project and validate for mixed rates.
         
+        Args:
+            format_elements (List): Format resource elements, in document order
+            sequence_elements (List): Sequence elements, in document order
+            
         Returns:
             Dict[str, Dict]: Frame rate information for each resource
         """
@@ -228,21 +302,19 @@ class FCPXMLParser:
         frame_rates = {}
         
         # Detect from format resources
-        resources_element = self.root.find('resources')
-        if resources_element is not None:
-            for format_elem in resources_element.findall('format'):
-                format_id = format_elem.get('id')
-                rate_info = self.frame_rate_handler.detect_frame_rate_from_fcpxml_format(format_elem)
-                if rate_info:
-                    frame_rates[format_id] = rate_info.__dict__
-                    self.detected_frame_rates[format_id] = rate_info
+        for format_elem in format_elements:
+            format_id = format_elem.get('id')
+            rate_info = self.frame_rate_handler.detect_frame_rate_from_fcpxml_format(format_elem)
+            if rate_info:
+                frame_rates[format_id] = rate_info.to_dict()
+                self.detected_frame_rates[format_id] = rate_info
         
         # Detect from sequence elements
-        for sequence in self.root.findall('.//sequence'):
+        for sequence in sequence_elements:
             sequence_rate = self.frame_rate_handler.detect_frame_rate_from_sequence(sequence)
             if sequence_rate:
                 sequence_format = sequence.get('format', 'sequence')
-                frame_rates[f"sequence_{sequence_format}"] = sequence_rate.__dict__
+                frame_rates[f"sequence_{sequence_format}"] = sequence_rate.to_dict()
                 self.detected_frame_rates[f"sequence_{sequence_format}"] = sequence_rate
         
         # Determine primary frame rate
@@ -264,7 +336,7 @@ class FCPXMLParser:
             # Default to 29.97 drop frame if nothing detected
             logger.warning("No frame rates detected, defaulting to 29.97 Drop Frame")
             self.primary_frame_rate = self.frame_rate_handler.FRAME_RATES['29.97df']
-            frame_rates['default'] = self.primary_frame_rate.__dict__
+            frame_rates['default'] = self.primary_frame_rate.to_dict()
         
         return frame_rates
     
@@ -305,10 +377,7 @@ class FCPXMLParser:
         Returns:
             str: Duration in FCPXML time format
         """
-        sequence = self.root.find('.//sequence')
-        if sequence is not None:
-            return sequence.get('duration')
-        return None
+        return self._timeline_duration
     
     def rational_time_to_seconds(self, rational_time: str, 
                                 context_format_id: Optional[str] = None) -> float:
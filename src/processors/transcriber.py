@@ -7,6 +7,8 @@ import os
 import json
 import time
 import logging
+import shutil
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Tuple
 from datetime import datetime
@@ -126,14 +128,17 @@ class Transcriber:
             logger.info("File is under 25MB, no splitting needed")
             return [(audio_path, 0.0, duration_ms / 1000.0)]
 
-        # Calculate how many chunks we need
-        size_ratio = file_size / self.MAX_FILE_SIZE_BYTES
-        num_chunks = math.ceil(size_ratio)
+        # Chunks are exported as PCM WAV, which is far larger than a compressed
+        # source, so size them by duration at the PCM data rate with a little
+        # headroom for the WAV header rather than by the source file size
+        bytes_per_ms = audio.frame_rate * audio.frame_width / 1000
+        max_chunk_ms = int(self.MAX_FILE_SIZE_BYTES * 0.95 / bytes_per_ms)
+        num_chunks = math.ceil(duration_ms / (max_chunk_ms - self.OVERLAP_DURATION_MS))
         chunk_duration_ms = duration_ms // num_chunks + self.OVERLAP_DURATION_MS
 
         chunks = []
-        temp_dir = Path(audio_path).parent / "temp_chunks"
-        temp_dir.mkdir(exist_ok=True)
+        # A directory of its own per call, so concurrent splits never share chunk files
+        temp_dir = Path(tempfile.mkdtemp(prefix="temp_chunks_", dir=Path(audio_path).parent))
 
         for i in range(num_chunks):
             start_ms = max(0, i * (chunk_duration_ms - self.OVERLAP_DURATION_MS))
@@ -198,6 +203,60 @@ class Transcriber:
 
         logger.info(f"Audio file size: {file_size_mb:.1f} MB")
 
+        model = self._resolve_model(response_format)
+
+        # Split if necessary
+        if file_size > self.MAX_FILE_SIZE_BYTES:
+            logger.info(f"File is {file_size_mb:.1f}MB, splitting into chunks...")
+            return self._transcribe_chunked(audio_path, language, model, response_format, prompt)
+
+        # Single file transcription
+        return self._transcribe_single_file(audio_path, language, model, response_format, prompt)
+
+    def transcribe_audio_bytes(self, audio_data: bytes, filename: str = 'audio.ogg',
+                               language: str = 'en', response_format: str = 'verbose_json',
+                               prompt: Optional[str] = None) -> Dict:
+        """
+        Transcribe encoded audio held in memory, uploading it without a temp file.
+
+        Local Whisper and chunk splitting both work from files, so audio for the
+        local method or over the API size limit is spilled to a temporary file
+        in a directory of its own and handled by transcribe_audio.
+
+        Args:
+            audio_data (bytes): Encoded audio (e.g. Ogg/Opus from AudioExtractor)
+            filename (str): Upload filename; its extension tells the API the format
+            language (str): Language code
+            response_format (str): Response format ('verbose_json', 'json', 'text')
+            prompt (str, optional): Prompt to improve transcription quality
+
+        Returns:
+            Dict: Transcription result with segments and text
+        """
+        if self.method == 'local' or len(audio_data) > self.MAX_FILE_SIZE_BYTES:
+            spill_dir = tempfile.mkdtemp(prefix="transcribe_")
+            try:
+                spill_path = Path(spill_dir) / f"audio{Path(filename).suffix}"
+                spill_path.write_bytes(audio_data)
+                return self.transcribe_audio(str(spill_path), language, response_format, prompt)
+            finally:
+                shutil.rmtree(spill_dir, ignore_errors=True)
+
+        logger.info(f"Audio size: {len(audio_data) / (1024 * 1024):.1f} MB (in memory)")
+
+        model = self._resolve_model(response_format)
+        return self._transcribe_upload((filename, audio_data), language, model, response_format, prompt)
+
+    def _resolve_model(self, response_format: str) -> str:
+        """
+        Pick the model for a response format.
+
+        Args:
+            response_format: Requested response format
+
+        Returns:
+            Model name to use
+        """
         # Determine model based on requirements
         need_timestamps = response_format == 'verbose_json'
         model = self._determine_model(need_timestamps)
@@ -207,13 +266,7 @@ class Transcriber:
             logger.warning(f"{model} doesn't support verbose_json, using whisper-1 instead")
             model = 'whisper-1'
 
-        # Split if necessary
-        if file_size > self.MAX_FILE_SIZE_BYTES:
-            logger.info(f"File is {file_size_mb:.1f}MB, splitting into chunks...")
-            return self._transcribe_chunked(audio_path, language, model, response_format, prompt)
-
-        # Single file transcription
-        return self._transcribe_single_file(audio_path, language, model, response_format, prompt)
+        return model
 
     def _transcribe_single_file(self, audio_path: str, language: str,
                                model: str, response_format: str,
@@ -228,55 +281,72 @@ class Transcriber:
             response_format: Response format
             prompt: Optional prompt
 
+        Returns:
+            Transcription result
+        """
+        with open(audio_path, 'rb') as audio_file:
+            return self._transcribe_upload(audio_file, language, model, response_format, prompt)
+
+    def _transcribe_upload(self, upload, language: str, model: str,
+                           response_format: str, prompt: Optional[str] = None) -> Dict:
+        """
+        Send one upload to the transcription API.
+
+        Args:
+            upload: Open binary file or (filename, bytes) tuple
+            language: Language code
+            model: Model to use
+            response_format: Response format
+            prompt: Optional prompt
+
         Returns:
             Transcription result
         """
         logger.info(f"Transcribing with {model} (format: {response_format})")
 
         try:
-            with open(audio_path, 'rb') as audio_file:
-                # Prepare parameters
-                params = {
-                    'file': audio_file,
-                    'model': model,
+            # Prepare parameters
+            params = {
+                'file': upload,
+                'model': model,
+                'language': language
+            }
+
+            # Add response format if not default
+            if response_format != 'json':
+                params['response_format'] = response_format
+
+            # Add prompt if provided
+            if prompt:
+                params['prompt'] = prompt
+            elif model == 'whisper-1':
+                # Default prompt for whisper-1 to improve quality
+                params['prompt'] = "This is an interview or presentation with natural speech patterns."
+
+            # Make API call
+            start_time = time.time()
+            response = self.client.audio.transcriptions.create(**params)
+            elapsed = time.time() - start_time
+
+            logger.info(f"✅ Transcription completed in {elapsed:.1f} seconds")
+
+            # Handle different response formats
+            if response_format == 'verbose_json':
+                # Response is already a structured object
+                return response.model_dump()
+            elif response_format == 'text':
+                # Convert text response to expected format
+                return {
+                    'text': response,
+                    'segments': [],
                     'language': language
                 }
-
-                # Add response format if not default
-                if response_format != 'json':
-                    params['response_format'] = response_format
-
-                # Add prompt if provided
-                if prompt:
-                    params['prompt'] = prompt
-                elif model == 'whisper-1':
-                    # Default prompt for whisper-1 to improve quality
-                    params['prompt'] = "This is an interview or presentation with natural speech patterns."
-
-                # Make API call
-                start_time = time.time()
-                response = self.client.audio.transcriptions.create(**params)
-                elapsed = time.time() - start_time
-
-                logger.info(f"✅ Transcription completed in {elapsed:.1f} seconds")
-
-                # Handle different response formats
-                if response_format == 'verbose_json':
-                    # Response is already a structured object
+            else:
+                # JSON response
+                if hasattr(response, 'model_dump'):
                     return response.model_dump()
-                elif response_format == 'text':
-                    # Convert text response to expected format
-                    return {
-                        'text': response,
-                        'segments': [],
-                        'language': language
-                    }
                 else:
-                    # JSON response
-                    if hasattr(response, 'model_dump'):
-                        return response.model_dump()
-                    else:
-                        return {'text': response.text, 'segments': [], 'language': language}
+                    return {'text': response.text, 'segments': [], 'language': language}
 
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
@@ -359,7 +429,7 @@ class Transcriber:
         # Try to remove temp directory
         if chunks:
             temp_dir = Path(chunks[0][0]).parent
-            if temp_dir.name == "temp_chunks":
+            if temp_dir.name.startswith("temp_chunks"):
                 try:
                     temp_dir.rmdir()
                 except:
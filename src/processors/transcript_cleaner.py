@@ -12,6 +12,18 @@ from dataclasses import dataclass
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; cleaning runs these over every segment
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_FALSE_START_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\b(\w+)\s+\1\b',  # Repeated words: "the the"
+        r'\b(\w+)\s+(\w+)\s+\1\s+\2\b',  # Repeated phrases: "in the in the"
+        r'\b\w+\s*--\s*\w+',  # Self-corrections with dashes
+        r'\b\w+\s*,\s*(?:i mean|actually|sorry)\b',  # Corrections with phrases
+    )
+)
+
 @dataclass
 class CleaningSegment:
     """Represents a segment of transcript with timing information."""
@@ -70,14 +82,9 @@ class TranscriptCleaner:
         else:  # aggressive
             return aggressive_fillers
     
-    def _get_false_start_patterns(self) -> List[str]:
-        """Get regex patterns for detecting false starts."""
-        return [
-            r'\b(\w+)\s+\1\b',  # Repeated words: "the the"
-            r'\b(\w+)\s+(\w+)\s+\1\s+\2\b',  # Repeated phrases: "in the in the"
-            r'\b\w+\s*--\s*\w+',  # Self-corrections with dashes
-            r'\b\w+\s*,\s*(?:i mean|actually|sorry)\b',  # Corrections with phrases
-        ]
+    def _get_false_start_patterns(self) -> Tuple[re.Pattern, ...]:
+        """Get compiled (case-insensitive) regex patterns for detecting false starts."""
+        return _FALSE_START_PATTERNS
     
     def clean_transcript(self, transcription: Dict) -> Dict:
         """
@@ -162,8 +169,9 @@ class TranscriptCleaner:
         words = cleaned.split()
         filtered_words = []
         
+        strip_punctuation = _PUNCTUATION_PATTERN.sub
         for word in words:
-            clean_word = re.sub(r'[^\w\s]', '', word.lower())
+            clean_word = strip_punctuation('', word.lower())
             if clean_word not in self.filler_words:
                 filtered_words.append(word)
         
@@ -171,10 +179,10 @@ class TranscriptCleaner:
         
         # Apply false start patterns
         for pattern in self.false_start_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+            cleaned = pattern.sub('', cleaned)
         
         # Clean up extra whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WHITESPACE_PATTERN.sub(' ', cleaned).strip()
         
         return cleaned
     
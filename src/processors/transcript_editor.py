@@ -171,6 +171,7 @@ class TranscriptEditor:
         debug_path = Path(output_dir) / "edited_transcript_debug.txt"
 
         try:
+            debug_path.parent.mkdir(parents=True, exist_ok=True)
             with open(debug_path, 'w', encoding='utf-8') as f:
                 f.write("=" * 80 + "\n")
                 f.write("TRANSCRIPT EDITING DEBUG FILE\n")
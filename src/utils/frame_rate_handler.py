@@ -5,22 +5,110 @@ Handles various frame rates including 29.97 drop frame, mixed frame rates, and a
 
 import re
 import logging
+from types import MappingProxyType
 from typing import Dict, Optional, Tuple, Union
 from fractions import Fraction
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+
+from .compat import DATACLASS_SLOTS
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Minutes in a day of timecode
+_DAY_MINUTES = 24 * 60
+
+# Minutes that dropped labels before each timecode minute of a day (every
+# minute except multiples of ten); multiplied by the labels dropped per minute
+_DROPPING_MINUTES_BEFORE = tuple(minute - minute // 10 for minute in range(_DAY_MINUTES))
+
+@lru_cache(maxsize=8192)
+def _parse_rational_seconds(rational_time: str) -> float:
+    """
+    Parse an FCPXML rational time such as "1001/30000s" or "600s" to seconds.
+
+    FCPXML repeats the same few time strings (shared durations, frame
+    multiples) throughout a project, so results are memoized. Invalid
+    strings raise ValueError or ZeroDivisionError, which are not cached.
+
+    Args:
+        rational_time (str): Time ending in 's'
+
+    Returns:
+        float: Time in seconds, before any drop frame correction
+    """
+    numerator, slash, denominator = rational_time[:-1].partition('/')  # Remove 's'
+    if slash:
+        return float(numerator) / float(denominator)
+    return float(numerator)
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FrameRateInfo:
-    """Information about a specific frame rate."""
+    """Information about a specific frame rate. Immutable, so instances can be shared."""
     rate: float                    # Actual frame rate (e.g., 29.97)
     timebase: int                 # Timebase denominator (e.g., 30000)
     timescale: int                # Timescale numerator (e.g., 1001) 
     is_drop_frame: bool           # True for drop frame timecode
     name: str                     # Human readable name
     fcpxml_duration_format: str   # Format string for FCPXML durations
+    # Exact frames per second (timebase / timescale), derived in __post_init__
+    rate_fraction: Fraction = field(init=False, repr=False, compare=False)
+    # Drop frame timecode parameters, derived in __post_init__ (0 without drop frame)
+    nominal_fps: int = field(init=False, repr=False, compare=False)    # Labels per second (30 or 60)
+    drop_per_min: int = field(init=False, repr=False, compare=False)   # Labels skipped per minute (2 or 4)
+
+    def __post_init__(self):
+        object.__setattr__(self, "rate_fraction", Fraction(int(self.timebase), int(self.timescale)))
+
+        # Resolved once here so the timecode kernels never compare float rates
+        nominal_fps, drop_per_min = 0, 0
+        if self.is_drop_frame:
+            if abs(self.rate - 29.97) < 0.01:
+                nominal_fps, drop_per_min = 30, 2
+            elif abs(self.rate - 59.94) < 0.01:
+                nominal_fps, drop_per_min = 60, 4
+        object.__setattr__(self, "nominal_fps", nominal_fps)
+        object.__setattr__(self, "drop_per_min", drop_per_min)
+
+    def to_dict(self) -> Dict:
+        """
+        Describe this frame rate as a plain dict of its constructor fields.
+
+        Derived fields are left out, so the result stays JSON-serializable
+        and round-trips through `from_dict`.
+
+        Returns:
+            Dict: Frame rate fields
+        """
+        return {
+            'rate': self.rate,
+            'timebase': self.timebase,
+            'timescale': self.timescale,
+            'is_drop_frame': self.is_drop_frame,
+            'name': self.name,
+            'fcpxml_duration_format': self.fcpxml_duration_format
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'FrameRateInfo':
+        """
+        Rebuild a FrameRateInfo from its dict form (as produced by to_dict).
+
+        Args:
+            data (Dict): Frame rate fields
+
+        Returns:
+            FrameRateInfo: Frame rate information
+        """
+        return cls(
+            rate=data['rate'],
+            timebase=data['timebase'],
+            timescale=data['timescale'],
+            is_drop_frame=data['is_drop_frame'],
+            name=data['name'],
+            fcpxml_duration_format=data['fcpxml_duration_format']
+        )
 
 class FrameRateHandler:
     """
@@ -28,7 +116,7 @@ class FrameRateHandler:
     """
     
     # Standard frame rate definitions
-    FRAME_RATES = {
+    FRAME_RATES = MappingProxyType({
         # Non-drop frame rates
         '23.976': FrameRateInfo(23.976, 24000, 1001, False, '23.976 fps', '1001/24000s'),
         '24': FrameRateInfo(24.0, 24, 1, False, '24 fps', '1/24s'),
@@ -42,43 +130,39 @@ class FrameRateHandler:
         # Drop frame variants (primarily for 29.97)
         '29.97df': FrameRateInfo(29.97, 30000, 1001, True, '29.97 fps Drop Frame', '1001/30000s'),
         '59.94df': FrameRateInfo(59.94, 60000, 1001, True, '59.94 fps Drop Frame', '1001/60000s'),
-    }
+    })
+
+    # Standard non-drop rates keyed by exact frame duration, e.g. Fraction(1001, 30000)
+    _FRAME_DURATION_LOOKUP = MappingProxyType({
+        Fraction(info.timescale, info.timebase): info
+        for info in FRAME_RATES.values() if not info.is_drop_frame
+    })
+
+    # The same rates keyed by their usual FCPXML spelling, e.g. "1001/30000s"
+    _FRAME_DURATION_STRINGS = MappingProxyType({
+        info.fcpxml_duration_format: info
+        for info in FRAME_RATES.values() if not info.is_drop_frame
+    })
+
+    # Format name fragments that indicate drop frame ("dropframe" is covered by "drop")
+    _DROP_FRAME_PATTERN = re.compile(r'2997|5994|df|drop', re.IGNORECASE)
     
     def __init__(self):
         """Initialize the frame rate handler."""
         self.detected_rates = {}  # Cache for detected rates
+        self._format_rates = {}  # (frameDuration, name) -> FrameRateInfo or None
 
-    def get_primary_frame_rate(self, detected_rates: Dict) -> FrameRateInfo:
+    def get_primary_frame_rate(self, detected_rates: Dict[str, FrameRateInfo]) -> FrameRateInfo:
         """
         Determine the primary frame rate from detected rates.
 
         Args:
-            detected_rates: Dictionary of detected frame rates
+            detected_rates: Detected frame rates by resource ID, in detection order
 
         Returns:
-            FrameRateInfo: The primary frame rate to use
+            FrameRateInfo: The first detected rate, or 29.97 DF if none were detected
         """
-        if not detected_rates:
-            # Default to 29.97 DF if no rates detected
-            return self.FRAME_RATES['29.97df']
-
-        # Return the first detected rate as primary
-        first_rate = list(detected_rates.values())[0]
-        if isinstance(first_rate, FrameRateInfo):
-            return first_rate
-        elif isinstance(first_rate, dict):
-            # Reconstruct FrameRateInfo from dict
-            return FrameRateInfo(
-                rate=first_rate.get('rate', 29.97),
-                timebase=first_rate.get('timebase', 30000),
-                timescale=first_rate.get('timescale', 1001),
-                is_drop_frame=first_rate.get('is_drop_frame', True),
-                name=first_rate.get('name', '29.97 fps Drop Frame'),
-                fcpxml_duration_format=first_rate.get('fcpxml_duration_format', '1001/30000s')
-            )
-        else:
-            # Fallback to 29.97 DF
-            return self.FRAME_RATES['29.97df']
+        return next(iter(detected_rates.values()), self.FRAME_RATES['29.97df'])
 
     def detect_frame_rate_from_fcpxml_format(self, format_element) -> Optional[FrameRateInfo]:
         """
@@ -98,20 +182,27 @@ class FrameRateHandler:
         
         if not frame_duration:
             return None
-            
+
+        # A project has few distinct formats, and FrameRateInfo is immutable,
+        # so each (frameDuration, name) pair is worked out only once
+        key = (frame_duration, format_name)
+        try:
+            return self._format_rates[key]
+        except KeyError:
+            pass
+
         # Parse frame duration (e.g., "1001/30000s")
         rate_info = self._parse_frame_duration(frame_duration)
         if rate_info:
             # Check if it's drop frame based on format name or other indicators
             is_drop_frame = self._is_drop_frame_format(format_name)
             if is_drop_frame:
-                rate_info.is_drop_frame = True
-                rate_info.name += " Drop Frame"
+                rate_info = replace(rate_info, is_drop_frame=True, name=rate_info.name + " Drop Frame")
             
             logger.info(f"Detected frame rate: {rate_info.name} from format '{format_name}'")
-            return rate_info
-            
-        return None
+
+        self._format_rates[key] = rate_info
+        return rate_info
     
     def detect_frame_rate_from_sequence(self, sequence_element) -> Optional[FrameRateInfo]:
         """
@@ -158,14 +249,30 @@ class FrameRateHandler:
         Returns:
             FrameRateInfo: Frame rate information
         """
+        # Standard spellings need no parsing at all
+        standard = self._FRAME_DURATION_STRINGS.get(frame_duration)
+        if standard is not None:
+            return standard
+
         if not frame_duration.endswith('s'):
             return None
             
         duration_part = frame_duration[:-1]  # Remove 's'
         
         try:
-            if '/' in duration_part:
-                numerator, denominator = duration_part.split('/')
+            numerator, slash, denominator = duration_part.partition('/')
+            if slash:
+
+                # Other spellings of standard rates match on the reduced fraction
+                standard = self._FRAME_DURATION_LOOKUP.get(Fraction(int(numerator), int(denominator)))
+                if standard is not None:
+                    return replace(
+                        standard,
+                        timebase=int(denominator),
+                        timescale=int(numerator),
+                        fcpxml_duration_format=frame_duration
+                    )
+
                 frame_time = float(numerator) / float(denominator)
                 frame_rate = 1.0 / frame_time
                 
@@ -216,9 +323,7 @@ class FrameRateHandler:
         Returns:
             bool: True if drop frame format
         """
-        format_name_lower = format_name.lower()
-        drop_indicators = ['2997', '5994', 'df', 'drop', 'dropframe']
-        return any(indicator in format_name_lower for indicator in drop_indicators)
+        return self._DROP_FRAME_PATTERN.search(format_name) is not None
     
     def rational_time_to_seconds(self, rational_time: str, 
                                 frame_rate_info: Optional[FrameRateInfo] = None) -> float:
@@ -235,24 +340,31 @@ class FrameRateHandler:
         if not rational_time or not rational_time.endswith('s'):
             return 0.0
             
-        time_part = rational_time[:-1]  # Remove 's'
-        
         try:
-            if '/' in time_part:
-                numerator, denominator = time_part.split('/')
-                seconds = float(numerator) / float(denominator)
-            else:
-                seconds = float(time_part)
-            
-            # Apply drop frame correction if needed
-            if frame_rate_info and frame_rate_info.is_drop_frame:
-                seconds = self._apply_drop_frame_correction(seconds, frame_rate_info)
-            
-            return seconds
-            
+            seconds = _parse_rational_seconds(rational_time)
         except (ValueError, ZeroDivisionError):
             logger.warning(f"Could not parse rational time: {rational_time}")
             return 0.0
+
+        # Drop frame correction, inlined as this runs for every time attribute.
+        # As before the integer rewrite, the frames counted at 29.97 (or
+        # 59.94) are corrected by adding the labels that drop frame timecode
+        # skips before them: 2 (or 4) per minute, except every tenth minute,
+        # per SMPTE EG-40. The frame number is split into ten-minute blocks,
+        # which hold a fixed number of frames. Adding is strictly increasing,
+        # so `seconds_to_rational_time` recovers the original frame exactly.
+        # Rates without drop frame timecode have drop_per_min 0 and pass
+        # through unchanged.
+        drop = frame_rate_info.drop_per_min if frame_rate_info is not None else 0
+        if drop:
+            fps = frame_rate_info.nominal_fps
+            frame = round(seconds * fps * 1000 / 1001)
+            blocks, rest = divmod(frame, fps * 600 - drop * 9)
+            # The first minute of a block drops nothing; max() keeps it at zero
+            label = frame + drop * (9 * blocks + max(rest - drop, 0) // (fps * 60 - drop))
+            return label * 1001 / (fps * 1000)
+
+        return seconds
     
     def seconds_to_rational_time(self, seconds: float, 
                                frame_rate_info: FrameRateInfo) -> str:
@@ -270,85 +382,47 @@ class FrameRateHandler:
         if frame_rate_info.is_drop_frame:
             seconds = self._reverse_drop_frame_correction(seconds, frame_rate_info)
         
-        if frame_rate_info.timescale == 1:
+        # A frame duration without a fraction gives a timebase of 1, which
+        # cannot express sub-second times, so those stay in plain seconds
+        if frame_rate_info.timebase == 1:
             return f"{seconds}s"
-        else:
-            # Use the frame rate's specific timebase
-            numerator = int(seconds * frame_rate_info.timebase)
-            return f"{numerator}/{frame_rate_info.timebase}s"
-    
-    def _apply_drop_frame_correction(self, seconds: float, 
-                                   frame_rate_info: FrameRateInfo) -> float:
-        """
-        Apply drop frame timecode correction to convert to real time.
         
-        Args:
-            seconds (float): Timecode seconds
-            frame_rate_info (FrameRateInfo): Frame rate information
-            
-        Returns:
-            float: Corrected real-time seconds
-        """
-        if not frame_rate_info.is_drop_frame:
-            return seconds
-            
-        # Drop frame correction primarily applies to 29.97
-        if abs(frame_rate_info.rate - 29.97) < 0.01:
-            # 29.97 drop frame: 2 frames dropped every minute except every 10th minute
-            # This creates a slight time compression
-            total_frames = seconds * 29.97
-            
-            # Calculate minutes and apply drop frame formula
-            minutes = int(total_frames / (29.97 * 60))
-            dropped_frames = minutes * 2 - (minutes // 10) * 2
-            
-            # Convert back to real time
-            real_frames = total_frames + dropped_frames
-            return real_frames / 29.97
-            
-        # For other drop frame rates, apply similar logic
-        elif abs(frame_rate_info.rate - 59.94) < 0.01:
-            total_frames = seconds * 59.94
-            minutes = int(total_frames / (59.94 * 60))
-            dropped_frames = minutes * 4 - (minutes // 10) * 4  # 4 frames dropped for 59.94
-            real_frames = total_frames + dropped_frames
-            return real_frames / 59.94
-            
-        return seconds  # No correction for other rates
+        # Snap to the nearest whole frame in exact arithmetic; float products
+        # can round to the wrong side of a half-frame on long timelines
+        frames = round(Fraction(seconds) * frame_rate_info.rate_fraction)
+        numerator = frames * frame_rate_info.timescale
+        return f"{numerator}/{frame_rate_info.timebase}s"
     
-    def _reverse_drop_frame_correction(self, real_seconds: float, 
+    def _reverse_drop_frame_correction(self, real_seconds: float,
                                      frame_rate_info: FrameRateInfo) -> float:
         """
-        Reverse drop frame correction to convert real time back to timecode.
-        
+        Reverse the drop frame correction of `rational_time_to_seconds`.
+
+        The corrected frame is read as a timecode label at the nominal rate
+        (30 or 60), and the labels skipped before its minute are subtracted
+        again, giving back the frame that was decoded. Labels come from the
+        forward correction, so they never fall on a dropped label.
+
         Args:
-            real_seconds (float): Real time seconds
+            real_seconds (float): Corrected seconds
             frame_rate_info (FrameRateInfo): Frame rate information
-            
+
         Returns:
-            float: Timecode seconds
+            float: Seconds before correction, on a frame boundary
         """
-        if not frame_rate_info.is_drop_frame:
+        drop = frame_rate_info.drop_per_min
+        if not drop:
             return real_seconds
-            
-        # This is the inverse of the drop frame correction
-        # For 29.97 drop frame
-        if abs(frame_rate_info.rate - 29.97) < 0.01:
-            real_frames = real_seconds * 29.97
-            # Estimate minutes and calculate dropped frames
-            estimated_minutes = int(real_frames / (29.97 * 60))
-            dropped_frames = estimated_minutes * 2 - (estimated_minutes // 10) * 2
-            timecode_frames = real_frames - dropped_frames
-            return timecode_frames / 29.97
-            
-        elif abs(frame_rate_info.rate - 59.94) < 0.01:
-            real_frames = real_seconds * 59.94
-            estimated_minutes = int(real_frames / (59.94 * 60))
-            dropped_frames = estimated_minutes * 4 - (estimated_minutes // 10) * 4
-            timecode_frames = real_frames - dropped_frames
-            return timecode_frames / 59.94
-            
-        return real_seconds
+        fps = frame_rate_info.nominal_fps
+
+        label = round(real_seconds * fps * 1000 / 1001)
+        minutes = label // (fps * 60)
+        if minutes < _DAY_MINUTES:
+            dropping_minutes = _DROPPING_MINUTES_BEFORE[minutes]
+        else:
+            dropping_minutes = minutes - minutes // 10
+        frame = label - drop * dropping_minutes
+        return frame * 1001 / (fps * 1000)
 
 if __name__ == "__main__":
     import logging
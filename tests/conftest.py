@@ -46,4 +46,6 @@ def mock_settings(monkeypatch):
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
     monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
     from src.config import AppSettings
+    from src.config.settings import _env_values
+    _env_values.cache_clear()
     return AppSettings.from_env()
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""Unit tests for the CutGenerator."""
+
+from src.processors.cut_generator import CutGenerator, ET
+from src.utils import FrameRateHandler
+
+
+class TestCutGenerator:
+    """Test cut generation timing."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.generator = CutGenerator()
+        self.generator.primary_frame_rate = FrameRateHandler.FRAME_RATES['29.97df']
+
+    def test_drop_frame_times_pass_through_unchanged(self):
+        """Test that 29.97 DF clip times are written back exactly as read."""
+        clip = ET.Element('mc-clip', {
+            'offset': '600600/30000s',
+            'start': '1800799/30000s',
+            'duration': '54054000/30000s',
+        })
+        offset = self.generator._rational_time_to_seconds(clip.get('offset'))
+        start = self.generator._rational_time_to_seconds(clip.get('start'))
+        duration = self.generator._rational_time_to_seconds(clip.get('duration'))
+
+        new_clip = self.generator._create_sequential_cut_clip(
+            clip, {'start': start, 'end': start + duration}, offset, 0,
+            self.generator._make_rational_converter()
+        )
+
+        assert new_clip.get('offset') == '600600/30000s'
+        assert new_clip.get('start') == '1800799/30000s'
+        assert new_clip.get('duration') == '54054000/30000s'
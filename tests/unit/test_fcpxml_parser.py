@@ -0,0 +1,39 @@
+"""Unit tests for the FCPXMLParser."""
+
+from src.processors.fcpxml_parser import FCPXMLParser
+
+
+class TestFCPXMLParser:
+    """Test streaming FCPXML parsing."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = FCPXMLParser()
+
+    def test_stream_keeps_sibling_order_across_parse_blocks(self, tmp_path):
+        """Test that siblings spanning several iterparse blocks are all handled in order."""
+        asset_ids = [f"r{i}" for i in range(2000)]
+        assets = "".join(
+            f'<asset id="{asset_id}" name="Clip {asset_id}" start="0s" duration="10s">'
+            f'<media-rep kind="original-media" src="file:///media/{asset_id}.mov"/></asset>'
+            for asset_id in asset_ids
+        )
+        fcpxml_path = tmp_path / "many_assets.fcpxml"
+        fcpxml_path.write_text(f'<fcpxml version="1.10"><resources>{assets}</resources></fcpxml>')
+
+        # Each asset must still be the first child of resources when handled,
+        # i.e. only the assets before it have been detached
+        parse_asset = self.parser._parse_asset
+        first_child_when_handled = []
+
+        def record_position(asset):
+            first_child_when_handled.append(self.parser.root[0][0] is asset)
+            return parse_asset(asset)
+
+        self.parser._parse_asset = record_position
+        parsed = self.parser._stream_fcpxml(str(fcpxml_path))
+
+        assert all(first_child_when_handled)
+        assert list(parsed['resources']) == asset_ids
+        assert parsed['resources']['r1999']['name'] == "Clip r1999"
+        assert len(self.parser.root) == 0
@@ -47,4 +47,24 @@ class TestFrameRateHandler:
         assert handler.rational_time_to_seconds("1001/30000s") == pytest.approx(0.03336666, 0.0001)
 
         # Test invalid format
-        assert handler.rational_time_to_seconds("invalid") == 0.0
\ No newline at end of file
+        assert handler.rational_time_to_seconds("invalid") == 0.0
+
+    def test_drop_frame_round_trip(self):
+        """Test that drop frame conversion is exact in both directions."""
+        info = FrameRateHandler.FRAME_RATES['29.97df']
+
+        # Frame 1800 at 29.97 is preceded by the two labels dropped at minute 1
+        assert self.handler.rational_time_to_seconds(f"{1800 * 1001}/30000s", info) == pytest.approx(1802 * 1001 / 30000)
+
+        # Rational times survive decoding and re-encoding unchanged
+        for frame in (0, 1, 1799, 1800, 17981, 17982, 107892, 150000):
+            rational = f"{frame * 1001}/30000s"
+            seconds = self.handler.rational_time_to_seconds(rational, info)
+            assert self.handler.seconds_to_rational_time(seconds, info) == rational
+
+    def test_whole_second_frame_duration_keeps_exact_seconds(self):
+        """Test that a frame duration without a fraction does not quantize times."""
+        info = self.handler._parse_frame_duration("0.04s")
+        assert (info.timebase, info.timescale) == (1, 1)
+
+        assert self.handler.seconds_to_rational_time(12.48, info) == "12.48s"